@@ -4,19 +4,53 @@
 
 Provides a session-scoped ResourceTracker that records every AWS resource
 created during the run so the final teardown can verify nothing leaked.
+
+Environment variables may also be provided through a local ``.env`` file.
+
+Tests can run in parallel with pytest-xdist (``pytest -n 4``) when
+NETWORKX_TEST_GRAPH_IDS lists one graph per worker. Each algorithm call
+resets the whole graph, so workers cannot share one.
 """
 
 import logging
+import os
 
 import boto3
 import pytest
 from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+
+# Everything below must run before nx_neptune is imported, since
+# NETWORKX_GRAPH_ID is read at import time. Loading .env here, once, also makes
+# it visible to BACKEND in utils.test_utils regardless of module import order.
+load_dotenv()
 
-from nx_neptune import NETWORKX_GRAPH_ID
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_TEST_GRAPH_IDS = [
+    g.strip() for g in os.environ.get("NETWORKX_TEST_GRAPH_IDS", "").split(",") if g.strip()
+]
+if _XDIST_WORKER and _TEST_GRAPH_IDS:
+    _worker_index = int(_XDIST_WORKER.removeprefix("gw"))
+    if _worker_index < len(_TEST_GRAPH_IDS):
+        os.environ["NETWORKX_GRAPH_ID"] = _TEST_GRAPH_IDS[_worker_index]
+
+from nx_neptune import NETWORKX_GRAPH_ID  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
 
+def pytest_configure(config):
+    """Refuse to fan out across xdist workers without one graph per worker."""
+    workers = getattr(config.option, "numprocesses", None)
+    if not workers or os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    if isinstance(workers, int) and len(_TEST_GRAPH_IDS) < workers:
+        raise pytest.UsageError(
+            f"Running with -n {workers} requires NETWORKX_TEST_GRAPH_IDS to list "
+            f"at least {workers} comma-separated graph IDs (got {len(_TEST_GRAPH_IDS)})"
+        )
+
+
 @pytest.fixture(scope="module", autouse=True)
 def _require_graph_id():
     if not NETWORKX_GRAPH_ID:
@@ -15,7 +15,7 @@ import os
 import pytest
 
 import networkx as nx
-from utils.test_utils import BACKEND, neptune_graph
+from utils.test_utils import BACKEND
 
 @pytest.fixture
 def digraph():
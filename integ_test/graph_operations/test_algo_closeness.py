@@ -15,7 +15,7 @@ import pytest
 
 import networkx as nx
 from nx_neptune import Node
-from utils.test_utils import BACKEND, neptune_graph, air_route_graph
+from utils.test_utils import BACKEND
 
 @pytest.fixture
 def graph():
@@ -69,9 +69,8 @@ class TestCloseness:
         """Test closeness centrality with write_property (mutation)"""
         nx.closeness_centrality(air_route_graph, backend=BACKEND, write_property="ccScore")
 
-        nodes = neptune_graph.get_all_nodes()[:10]
+        nodes = neptune_graph.get_all_nodes(limit=10)
         assert len(nodes) > 0
-
         # Verify nodes exist after mutation
         for item in nodes:
             node = Node.from_neptune_response(item)
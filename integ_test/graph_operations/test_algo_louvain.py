@@ -15,28 +15,34 @@ import pytest
 
 import networkx as nx
 from nx_neptune import Node
-from utils.test_utils import BACKEND, neptune_graph
+from utils.test_utils import BACKEND
 
 @pytest.fixture
 def graph():
     """Create a new undirected graph"""
     return nx.Graph()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_graph():
-    """Create test graph with community structure and weights"""
+    """Create test graph with community structure and weights.
+
+    Shared across the module since no test modifies it; each algorithm
+    call re-syncs it to Neptune anyway.
+    """
     g = nx.Graph()
     # Create two communities with weighted edges
-    # Community 1: A-B-C triangle
-    g.add_edge("A", "B", custom_weight=1)
-    g.add_edge("B", "C", custom_weight=1)
-    g.add_edge("C", "A", custom_weight=1)
-    # Community 2: D-E-F triangle
-    g.add_edge("D", "E", custom_weight=1)
-    g.add_edge("E", "F", custom_weight=1)
-    g.add_edge("F", "D", custom_weight=1)
-    # Bridge between communities (weaker connection)
-    g.add_edge("C", "D", custom_weight=0.5)
+    g.add_edges_from([
+        # Community 1: A-B-C triangle
+        ("A", "B", {"custom_weight": 1}),
+        ("B", "C", {"custom_weight": 1}),
+        ("C", "A", {"custom_weight": 1}),
+        # Community 2: D-E-F triangle
+        ("D", "E", {"custom_weight": 1}),
+        ("E", "F", {"custom_weight": 1}),
+        ("F", "D", {"custom_weight": 1}),
+        # Bridge between communities (weaker connection)
+        ("C", "D", {"custom_weight": 0.5}),
+    ])
     return g
 
 class TestLouvain:
@@ -52,58 +58,22 @@ class TestLouvain:
             assert isinstance(community, set)
             assert len(community) > 0
 
-    def test_louvain_communities_with_weight(self, test_graph):
-        """Test Louvain communities with weight parameter"""
-        result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
-                                                 weight="custom_weight")
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_louvain_communities_with_max_level(self, test_graph):
-        """Test Louvain communities with max_level parameter"""
-        result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
-                                                 max_level=100)
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_louvain_communities_with_threshold(self, test_graph):
-        """Test Louvain communities with threshold parameter"""
-        result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
-                                                 threshold=0.5)
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_louvain_communities_with_level_tolerance(self, test_graph):
-        """Test Louvain communities with level_tolerance parameter"""
-        result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
-                                                 level_tolerance=0.5)
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_louvain_communities_with_max_iterations(self, test_graph):
-        """Test Louvain communities with max_iterations parameter"""
-        result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
-                                                 max_iterations=100)
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_louvain_communities_with_concurrency(self, test_graph):
-        """Test Louvain communities with concurrency parameter"""
-        result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
-                                                 concurrency=1)
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_louvain_communities_with_edge_labels(self, test_graph):
-        """Test Louvain communities with edge_labels parameter"""
-        result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
-                                                 edge_labels=["RELATES_TO"])
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"weight": "custom_weight"},
+            {"max_level": 100},
+            {"threshold": 0.5},
+            {"level_tolerance": 0.5},
+            {"max_iterations": 100},
+            {"concurrency": 1},
+            {"edge_labels": ["RELATES_TO"]},
+        ],
+        ids=lambda kwargs: next(iter(kwargs)),
+    )
+    def test_louvain_communities_with_options(self, test_graph, kwargs):
+        """Test Louvain communities with each supported option"""
+        result = nx.community.louvain_communities(test_graph, backend=BACKEND, **kwargs)
         
         assert isinstance(result, list)
         assert len(result) > 0
@@ -113,9 +83,8 @@ class TestLouvain:
         result = nx.community.louvain_communities(test_graph, backend=BACKEND, 
                                                  write_property="communities")
         
-        nodes = neptune_graph.get_all_nodes()[:10]
+        nodes = neptune_graph.get_all_nodes(limit=10)
         assert len(nodes) > 0
-        
         # Verify nodes exist after mutation
         for item in nodes:
             node = Node.from_neptune_response(item)
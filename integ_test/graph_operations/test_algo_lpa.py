@@ -15,7 +15,7 @@ import pytest
 
 import networkx as nx
 from nx_neptune import Node
-from utils.test_utils import BACKEND, air_route_graph, neptune_graph
+from utils.test_utils import BACKEND
 
 @pytest.fixture
 def graph():
@@ -41,86 +41,47 @@ def test_graph():
 
 class TestLPA:
 
-    def test_label_propagation_communities_basic(self, air_route_graph):
-        """Test basic label propagation communities on airline routes data"""
-        result = nx.community.label_propagation_communities(air_route_graph, backend=BACKEND)
-        communities = list(result)
-
-        assert isinstance(communities, list)
-        assert len(communities) > 0
-
-        # Verify communities are sets
-        for community in communities:
-            assert isinstance(community, set)
-            assert len(community) > 0
-
-    def test_fast_label_propagation_communities_basic(self, air_route_graph):
-        """Test fast label propagation communities on airline routes data"""
-        result = nx.community.fast_label_propagation_communities(air_route_graph, backend=BACKEND)
-
-        communities = list(result)
-        assert isinstance(communities, list)
-        assert len(communities) > 0
-
-        for community in communities:
-            assert isinstance(community, set)
-            assert len(community) > 0
-
-    def test_asyn_lpa_communities_basic(self, air_route_graph):
-        """Test asynchronous label propagation communities on airline routes data"""
-        result = nx.community.asyn_lpa_communities(air_route_graph, backend=BACKEND)
+    @pytest.mark.parametrize(
+        "algorithm",
+        [
+            nx.community.label_propagation_communities,
+            nx.community.fast_label_propagation_communities,
+            nx.community.asyn_lpa_communities,
+        ],
+        ids=lambda algorithm: algorithm.__name__,
+    )
+    def test_lpa_communities_basic(self, air_route_graph, algorithm):
+        """Test each label propagation variant on airline routes data"""
+        result = algorithm(air_route_graph, backend=BACKEND)
 
         communities = list(result)
         assert isinstance(communities, list)
         assert len(communities) > 0
 
+        # Verify communities are sets
         for community in communities:
             assert isinstance(community, set)
             assert len(community) > 0
 
-    def test_label_propagation_communities_mutation(self, air_route_graph, neptune_graph):
-        """Test label propagation communities with write_property (mutation)"""
-        result = nx.community.label_propagation_communities(
-            air_route_graph,
-            backend=BACKEND,
-            write_property="communities"
-        )
-
-        nodes = neptune_graph.get_all_nodes()[:10]
-        assert len(nodes) > 0
-        for n in nodes:
-            node = Node.from_neptune_response(n)
-            assert node is not None
-            assert "communities" in node.properties
-
-    @pytest.mark.skipif(BACKEND != "neptune", reason="requires BACKEND='neptune'")
-    def test_fast_label_propagation_communities_mutation(self, air_route_graph, neptune_graph):
-
-        """Test fast label propagation communities with write_property (mutation)"""
-        result = nx.community.fast_label_propagation_communities(
+    @pytest.mark.parametrize(
+        "algorithm",
+        [
+            nx.community.label_propagation_communities,
+            nx.community.fast_label_propagation_communities,
+            nx.community.asyn_lpa_communities,
+        ],
+        ids=lambda algorithm: algorithm.__name__,
+    )
+    def test_lpa_communities_mutation(self, air_route_graph, neptune_graph, algorithm):
+        """Test each label propagation variant with write_property (mutation)"""
+        result = algorithm(
             air_route_graph,
             backend=BACKEND,
             write_property="communities"
         )
         assert len(result) == 0
 
-        nodes = neptune_graph.get_all_nodes()[:10]
-        assert len(nodes) > 0
-        for n in nodes:
-            node = Node.from_neptune_response(n)
-            assert node is not None
-            assert "communities" in node.properties
-
-    @pytest.mark.skipif(BACKEND != "neptune", reason="requires BACKEND='neptune'")
-    def test_asyn_lpa_communities_mutation(self, air_route_graph, neptune_graph):
-        """Test asynchronous label propagation communities with write_property (mutation)"""
-        result = nx.community.asyn_lpa_communities(
-            air_route_graph,
-            backend=BACKEND,
-            write_property="communities"
-        )
-
-        nodes = neptune_graph.get_all_nodes()[:10]
+        nodes = neptune_graph.get_all_nodes(limit=10)
         assert len(nodes) > 0
         for n in nodes:
             node = Node.from_neptune_response(n)
@@ -15,25 +15,29 @@ import pytest
 
 import networkx as nx
 from nx_neptune import Node
-from utils.test_utils import BACKEND, air_route_graph, neptune_graph
+from utils.test_utils import BACKEND
 
 @pytest.fixture
 def digraph():
     """Create a new directed graph"""
     return nx.DiGraph()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_digraph():
-    """Create test directed graph with specific structure"""
+    """Create test directed graph with specific structure.
+
+    Module-scoped: the tests only read this graph, so it is built once
+    and reused rather than rebuilt for every test.
+    """
     g = nx.DiGraph()
-    nodes = ['A', 'B', 'C', 'D', 'E']
-    g.add_nodes_from(nodes)
-    g.add_edge('A', 'B')
-    g.add_edge('B', 'C')
-    g.add_edge('C', 'D')
-    g.add_edge('D', 'E')
-    g.add_edge('E', 'C', weight=1)
-    g.add_node("X(DCd)")
+    g.add_nodes_from(['A', 'B', 'C', 'D', 'E', "X(DCd)"])
+    g.add_edges_from([
+        ('A', 'B'),
+        ('B', 'C'),
+        ('C', 'D'),
+        ('D', 'E'),
+        ('E', 'C', {'weight': 1}),
+    ])
     return g
 
 class TestPageRank:
@@ -47,47 +51,24 @@ class TestPageRank:
         assert all(isinstance(v, float) for v in r.values())
         assert all(v >= 0 for v in r.values())
 
-    def test_pagerank_with_vertex_label(self, test_digraph):
-        """Test PageRank with vertex_label option"""
-        r = nx.pagerank(test_digraph, backend=BACKEND, vertex_label="Node")
-        
-        assert isinstance(r, dict)
-        assert len(r) == 6
-
-    @pytest.mark.skipif(BACKEND != "neptune", reason="requires BACKEND='neptune'")
-    def test_pagerank_with_edge_labels(self, test_digraph):
-        """Test PageRank with edge_labels option"""
-        r = nx.pagerank(test_digraph, backend=BACKEND, edge_labels=["RELATES_TO"])
-        
-        assert isinstance(r, dict)
-        assert len(r) == 6
-
-    def test_pagerank_with_concurrency(self, test_digraph):
-        """Test PageRank with concurrency option"""
-        r = nx.pagerank(test_digraph, backend=BACKEND, concurrency=0)
-        
-        assert isinstance(r, dict)
-        assert len(r) == 6
-
-    def test_pagerank_with_traversal_direction(self, test_digraph):
-        """Test PageRank with traversal_direction option"""
-        r = nx.pagerank(test_digraph, backend=BACKEND, traversal_direction="inbound")
-        
-        assert isinstance(r, dict)
-        assert len(r) == 6
-
-    def test_pagerank_with_edge_weights(self, test_digraph):
-        """Test PageRank with edge weight options"""
-        r = nx.pagerank(test_digraph, backend=BACKEND, 
-                       edge_weight_type="int", edge_weight_property="weight")
-        
-        assert isinstance(r, dict)
-        assert len(r) == 6
-
-    def test_pagerank_with_source_nodes_weights(self, test_digraph):
-        """Test PageRank with source_nodes and source_weights"""
-        r = nx.pagerank(test_digraph, backend=BACKEND, 
-                       source_nodes=["A", "B"], source_weights=[1, 1.5])
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"vertex_label": "Node"},
+            pytest.param(
+                {"edge_labels": ["RELATES_TO"]},
+                marks=pytest.mark.skipif(BACKEND != "neptune", reason="requires BACKEND='neptune'"),
+            ),
+            {"concurrency": 0},
+            {"traversal_direction": "inbound"},
+            {"edge_weight_type": "int", "edge_weight_property": "weight"},
+            {"source_nodes": ["A", "B"], "source_weights": [1, 1.5]},
+        ],
+        ids=lambda kwargs: next(iter(kwargs)),
+    )
+    def test_pagerank_with_options(self, test_digraph, kwargs):
+        """Test PageRank with each supported option"""
+        r = nx.pagerank(test_digraph, backend=BACKEND, **kwargs)
         
         assert isinstance(r, dict)
         assert len(r) == 6
@@ -106,7 +87,7 @@ class TestPageRank:
         """Test PageRank with write_property (mutation)"""
         r = nx.pagerank(test_digraph, backend=BACKEND, write_property="rank")
         
-        nodes = neptune_graph.get_all_nodes()[:10]
+        nodes = neptune_graph.get_all_nodes(limit=10)
         assert len(nodes) > 0
         
         # Verify nodes exist after mutation
@@ -2,13 +2,30 @@
 # SPDX-License-Identifier: Apache-2.0
 """Integration tests for NeptuneGraph CRUD operations."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from nx_neptune import Node, Edge
 
 
+@pytest.fixture(scope="module")
+def background_clear(neptune_graph):
+    """Run clear_graph on a worker thread.
+
+    Each test's truncate is issued at teardown and only waited on by the next
+    test's setup, so it overlaps pytest's own bookkeeping between tests.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = [executor.submit(neptune_graph.clear_graph)]
+        yield executor, pending
+
+
 @pytest.fixture(autouse=True)
-def setup_before_test(neptune_graph):
-    neptune_graph.clear_graph()
+def setup_before_test(neptune_graph, background_clear):
+    executor, pending = background_clear
+    pending.pop().result()
+    yield
+    pending.append(executor.submit(neptune_graph.clear_graph))
 
 
 class TestAddAndGetNodes:
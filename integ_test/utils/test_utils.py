@@ -11,61 +11,73 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import os
+from pathlib import Path
+
 import pytest
 import pandas as pd
 import requests
 import networkx as nx
-from nx_neptune import NeptuneGraph, NETWORKX_GRAPH_ID
+from filelock import FileLock
+from platformdirs import user_cache_dir
+
+# pyarrow is optional: use its multithreaded CSV reader when it is installed
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = {"engine": "pyarrow", "dtype_backend": "pyarrow"}
+except ImportError:
+    _CSV_ENGINE = {"dtype": "category"}
 
 __all__ = [
     "BACKEND",
     "air_route_graph",
-    "neptune_graph"
 ]
 
 BACKEND = os.environ.get("BACKEND") or "neptune"
 if BACKEND == "False" or BACKEND == "None":
     BACKEND=None
 
-@pytest.fixture(scope="module", autouse=True)
-def neptune_graph():
-    """Setup Neptune graph for testing"""
-    if not NETWORKX_GRAPH_ID:
-        pytest.skip('Environment Variable "NETWORKX_GRAPH_ID" is not defined')
+@pytest.fixture(scope="session")
+def air_route_graph():
+    """Create airline routes graph from resources data.
 
-    print(f"\nRun tests using BACKEND={BACKEND}")
-    print(f"graph_identifier={NETWORKX_GRAPH_ID}")
+    Session-scoped: the graph is only read by tests, so the CSV is parsed
+    and the graph built once per run.
+    """
+    routes_url = "https://raw.githubusercontent.com/jpatokal/openflights/master/data/routes.dat"
 
-    g = nx.Graph()
-    na_graph = NeptuneGraph.from_config(graph=g)
-    return na_graph
+    # Cache outside the checkout so repeated runs and xdist workers share one copy
+    cache_dir = Path(user_cache_dir("nx_neptune_tests"))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    routes_file = cache_dir / "routes.dat"
 
-@pytest.fixture(scope="module")
-def air_route_graph():
-    """Create airline routes graph from resources data"""
-    routes_url = "https://raw.githubusercontent.com/jpatokal/openflights/master/data/routes.dat"
-    routes_file = "integ_test/resources/test_data_routes.dat"
-    
-    # Ensure the directory exists
-    os.makedirs(os.path.dirname(routes_file), exist_ok=True)
-    
-    # Download only if file doesn't exist
-    if not os.path.isfile(routes_file):
-        with open(routes_file, "wb") as f:
-            f.write(requests.get(routes_url).content)
+    # Only one worker downloads; the others wait on the lock and reuse the file
+    with FileLock(str(routes_file) + ".lock"):
+        if not routes_file.is_file():
+            partial_file = routes_file.with_suffix(".part")
+            # stream straight to disk instead of buffering the whole body in memory
+            with requests.get(routes_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                with open(partial_file, "wb") as f:
+                    # iter_content undoes any Content-Encoding; response.raw would not
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            # an interrupted download never lands at the cached path
+            os.replace(partial_file, routes_file)
     
     cols = [
         "airline", "airline_id", "source_airport", "source_airport_id",
         "dest_airport", "dest_airport_id", "codeshare", "stops", "equipment"
     ]
     
-    routes_df = pd.read_csv(routes_file, names=cols, header=None)
-    air_route_graph = nx.Graph()  # use Graph for un-directed air routes
+    # only the airport columns are used, skip parsing the rest; select them
+    # by position since the pyarrow engine rejects usecols names with names=cols
+    usecols = ["source_airport", "dest_airport"]
+    routes_df = pd.read_csv(
+        routes_file, names=usecols, header=None,
+        usecols=[cols.index(c) for c in usecols], **_CSV_ENGINE
+    ).dropna()
 
-    for _, row in routes_df.iterrows():
-        src = row["source_airport"]
-        dst = row["dest_airport"]
-        if pd.notnull(src) and pd.notnull(dst):
-            air_route_graph.add_edge(src, dst)
-    
-    return air_route_graph
\ No newline at end of file
+    # use Graph for un-directed air routes
+    return nx.from_pandas_edgelist(
+        routes_df, source="source_airport", target="dest_airport", create_using=nx.Graph()
+    )
\ No newline at end of file
@@ -10,51 +10,55 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-from .algorithms import louvain_communities
-from .algorithms.centrality.closeness import closeness_centrality
-from .algorithms.centrality.degree_centrality import (
-    degree_centrality,
-    in_degree_centrality,
-    out_degree_centrality,
-)
-from .algorithms.communities.label_propagation import (
-    asyn_lpa_communities,
-    fast_label_propagation_communities,
-    label_propagation_communities,
-)
-from .algorithms.link_analysis.pagerank import pagerank
-from .algorithms.traversal.bfs import bfs_edges, bfs_layers, descendants_at_distance
-from .clients import Edge, Node
-from .instance_management import (
-    create_csv_table_from_s3,
-    create_graph_snapshot,
-    create_iceberg_table_from_table,
-    create_na_instance,
-    create_na_instance_from_snapshot,
-    create_na_instance_with_s3_import,
-    delete_graph_snapshot,
-    delete_na_instance,
-    drop_athena_table,
-    empty_s3_bucket,
-    export_athena_table_to_s3,
-    export_csv_to_s3,
-    get_athena_query_results,
-    import_csv_from_s3,
-    start_na_instance,
-    stop_na_instance,
-    update_na_instance_size,
-    validate_athena_query,
-    validate_permissions,
-)
-from .interface import BackendInterface
-from .na_graph import (
-    NETWORKX_GRAPH_ID,
-    NETWORKX_S3_IAM_ROLE_ARN,
-    NeptuneGraph,
-    set_config_graph_id,
-)
-from .session_manager import CleanupTask, SessionManager
-from .utils.decorators import configure_if_nx_active
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .algorithms import louvain_communities
+    from .algorithms.centrality.closeness import closeness_centrality
+    from .algorithms.centrality.degree_centrality import (
+        degree_centrality,
+        in_degree_centrality,
+        out_degree_centrality,
+    )
+    from .algorithms.communities.label_propagation import (
+        asyn_lpa_communities,
+        fast_label_propagation_communities,
+        label_propagation_communities,
+    )
+    from .algorithms.link_analysis.pagerank import pagerank
+    from .algorithms.traversal.bfs import bfs_edges, bfs_layers, descendants_at_distance
+    from .clients import Edge, Node
+    from .instance_management import (
+        create_csv_table_from_s3,
+        create_graph_snapshot,
+        create_iceberg_table_from_table,
+        create_na_instance,
+        create_na_instance_from_snapshot,
+        create_na_instance_with_s3_import,
+        delete_graph_snapshot,
+        delete_na_instance,
+        drop_athena_table,
+        empty_s3_bucket,
+        export_athena_table_to_s3,
+        export_csv_to_s3,
+        get_athena_query_results,
+        import_csv_from_s3,
+        start_na_instance,
+        stop_na_instance,
+        update_na_instance_size,
+        validate_athena_query,
+        validate_permissions,
+    )
+    from .interface import BackendInterface
+    from .na_graph import (
+        NETWORKX_GRAPH_ID,
+        NETWORKX_S3_IAM_ROLE_ARN,
+        NeptuneGraph,
+        set_config_graph_id,
+    )
+    from .session_manager import CleanupTask, SessionManager
+    from .utils.decorators import configure_if_nx_active
 
 __version__ = "0.7.0"
 
@@ -106,3 +110,65 @@ __all__ = [
     "SessionManager",
     "CleanupTask",
 ]
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in every algorithm, client and instance management
+# module up front.
+_LAZY_IMPORTS = {
+    "louvain_communities": ".algorithms",
+    "closeness_centrality": ".algorithms.centrality.closeness",
+    "degree_centrality": ".algorithms.centrality.degree_centrality",
+    "in_degree_centrality": ".algorithms.centrality.degree_centrality",
+    "out_degree_centrality": ".algorithms.centrality.degree_centrality",
+    "asyn_lpa_communities": ".algorithms.communities.label_propagation",
+    "fast_label_propagation_communities": ".algorithms.communities.label_propagation",
+    "label_propagation_communities": ".algorithms.communities.label_propagation",
+    "pagerank": ".algorithms.link_analysis.pagerank",
+    "bfs_edges": ".algorithms.traversal.bfs",
+    "bfs_layers": ".algorithms.traversal.bfs",
+    "descendants_at_distance": ".algorithms.traversal.bfs",
+    "Edge": ".clients",
+    "Node": ".clients",
+    "create_csv_table_from_s3": ".instance_management",
+    "create_graph_snapshot": ".instance_management",
+    "create_iceberg_table_from_table": ".instance_management",
+    "create_na_instance": ".instance_management",
+    "create_na_instance_from_snapshot": ".instance_management",
+    "create_na_instance_with_s3_import": ".instance_management",
+    "delete_graph_snapshot": ".instance_management",
+    "delete_na_instance": ".instance_management",
+    "drop_athena_table": ".instance_management",
+    "empty_s3_bucket": ".instance_management",
+    "export_athena_table_to_s3": ".instance_management",
+    "export_csv_to_s3": ".instance_management",
+    "get_athena_query_results": ".instance_management",
+    "import_csv_from_s3": ".instance_management",
+    "start_na_instance": ".instance_management",
+    "stop_na_instance": ".instance_management",
+    "update_na_instance_size": ".instance_management",
+    "validate_athena_query": ".instance_management",
+    "validate_permissions": ".instance_management",
+    "BackendInterface": ".interface",
+    "NETWORKX_GRAPH_ID": ".na_graph",
+    "NETWORKX_S3_IAM_ROLE_ARN": ".na_graph",
+    "NeptuneGraph": ".na_graph",
+    "set_config_graph_id": ".na_graph",
+    "CleanupTask": ".session_manager",
+    "SessionManager": ".session_manager",
+    "configure_if_nx_active": ".utils.decorators",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -13,7 +13,11 @@
 import logging
 from typing import Any, List, Optional
 
-from nx_neptune.algorithms.util.algorithm_utils import execute_mutation_query
+from nx_neptune.algorithms.util.algorithm_utils import (
+    execute_mutation_query,
+    graph_node_count,
+    single_node_result,
+)
 from nx_neptune.clients.neptune_constants import (
     PARAM_CONCURRENCY,
     PARAM_EDGE_LABELS,
@@ -60,7 +64,7 @@ def degree_centrality(
     refer to: https://docs.aws.amazon.com/neptune-analytics/latest/userguide/degree-mutate.html
     """
     return _degree_centrality(
-        neptune_graph, None, vertex_label, edge_labels, concurrency, write_property
+        neptune_graph, vertex_label, edge_labels, concurrency, write_property
     )
 
 
@@ -87,11 +91,11 @@ def in_degree_centrality(
     """
     return _degree_centrality(
         neptune_graph,
-        PARAM_TRAVERSAL_DIRECTION_INBOUND,
         vertex_label,
         edge_labels,
         concurrency,
         write_property,
+        traversal_direction=PARAM_TRAVERSAL_DIRECTION_INBOUND,
     )
 
 
@@ -104,7 +108,7 @@ def out_degree_centrality(
     write_property: Optional[str] = None,
 ):
     """
-    Executes Degree algorithm on the graph with inbound edges.
+    Executes Degree algorithm on the graph with outbound edges.
     link: https://docs.aws.amazon.com/neptune-analytics/latest/userguide/degree.html
 
     :param neptune_graph: A NeptuneGraph instance
@@ -118,28 +122,28 @@ def out_degree_centrality(
     """
     return _degree_centrality(
         neptune_graph,
-        PARAM_TRAVERSAL_DIRECTION_OUTBOUND,
         vertex_label,
         edge_labels,
         concurrency,
         write_property,
+        traversal_direction=PARAM_TRAVERSAL_DIRECTION_OUTBOUND,
     )
 
 
 def _degree_centrality(
     neptune_graph: NeptuneGraph,
-    traversal_direction: Optional[str] = None,
     vertex_label: Optional[str] = None,
     edge_labels: Optional[List] = None,
     concurrency: Optional[int] = None,
     write_property: Optional[str] = None,
+    *,
+    traversal_direction: Optional[str] = None,
 ):
     """
     Compute the degree centrality for nodes.
     link: https://docs.aws.amazon.com/neptune-analytics/latest/userguide/degree.html
 
     :param neptune_graph: A NeptuneGraph instance
-    :param traversal_direction: The direction of edge to follow.
     :param vertex_label: A vertex label for vertex filtering.
     :param edge_labels: To filter on one more edge labels, provide a list of the ones to filter on.
     If no edgeLabels field is provided then all edge labels are processed during traversal.
@@ -147,9 +151,10 @@ def _degree_centrality(
     :param write_property: Specifies the name of the node property that will store the computed degree values.
     For comprehensive usage details,
     refer to: https://docs.aws.amazon.com/neptune-analytics/latest/userguide/degree-mutate.html
+    :param traversal_direction: The direction of edge to follow.
     """
     logger.debug(
-        f"nx_neptune.degree_centrality() with: \nneptune_graph={neptune_graph}"
+        "nx_neptune.degree_centrality() with: \nneptune_graph=%s", neptune_graph
     )
 
     # Process all parameters
@@ -168,10 +173,6 @@ def _degree_centrality(
     if concurrency is not None:
         parameters[PARAM_CONCURRENCY] = concurrency
 
-    # Execute PageRank algorithm
-    if parameters is None:
-        parameters = {}
-
     if write_property:
         parameters[PARAM_WRITE_PROPERTY] = write_property
         return execute_mutation_query(
@@ -181,14 +182,24 @@ def _degree_centrality(
             degree_centrality_mutation_query,
         )
     else:
-        query_str, para_map = degree_centrality_query(parameters)
+        # Mirror NX, which defines the centrality of a lone node as 1
+        trivial_result = single_node_result(neptune_graph, 1.0)
+        if trivial_result is not None:
+            return trivial_result
+
+        # Have Neptune normalise the degrees the same way as the NX implementation,
+        # over the nodes Neptune actually holds
+        node_count = graph_node_count(neptune_graph)
+        if node_count < 2:
+            # NX defines the centrality of a lone node as 1, and of an empty graph as {}
+            query_str, para_map = degree_centrality_query(parameters)
+            json_result = neptune_graph.execute_call(query_str, para_map)
+            return {item[RESPONSE_ID]: 1.0 for item in json_result}
+
+        scale = 1.0 / (node_count - 1)
+        query_str, para_map = degree_centrality_query(parameters, scale)
         json_result = neptune_graph.execute_call(query_str, para_map)
 
-        # Convert the result to a dictionary of node.id:degree pairs
-        result = {}
-        node_count = neptune_graph.graph.number_of_nodes()
-        for item in json_result:
-            # Normalised value to be compatible with NX implementation
-            result[item[RESPONSE_ID]] = item[RESPONSE_DEGREE] / (node_count - 1)
-
-        return result
+        # Convert the result to a dictionary of node.id:degree centrality pairs
+        id_key, degree_key = RESPONSE_ID, RESPONSE_DEGREE
+        return {item[id_key]: item[degree_key] for item in json_result}
@@ -11,10 +11,15 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import logging
+from collections.abc import Mapping
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 from nx_neptune.algorithms.util import process_unsupported_param
-from nx_neptune.algorithms.util.algorithm_utils import execute_mutation_query
+from nx_neptune.algorithms.util.algorithm_utils import (
+    execute_mutation_query,
+    single_node_result,
+)
 from nx_neptune.clients.neptune_constants import (
     PARAM_CONCURRENCY,
     PARAM_DAMPING_FACTOR,
@@ -31,21 +36,59 @@ from nx_neptune.clients.neptune_constants import (
     PARAM_TRAVERSAL_DIRECTION,
     PARAM_VERTEX_LABEL,
     PARAM_WRITE_PROPERTY,
+    RESPONSE_NODE_ID,
     RESPONSE_RANK,
 )
 from nx_neptune.clients.opencypher_builder import (
     _PAGERANK_MUTATE_ALG,
-    Node,
     pagerank_mutation_query,
     pagerank_query,
 )
 from nx_neptune.na_graph import NeptuneGraph
 from nx_neptune.utils.decorators import configure_if_nx_active
 
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for pagerank(..., return_numpy=True)
+    np = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["pagerank"]
 
+# Query text for a call with nothing but NX defaults, built once rather than per call;
+# the parameter map is not shared, so each call gets its own
+_DEFAULT_PAGERANK_QUERY_STR = pagerank_query()[0]
+
+
+class RankResult(Mapping):
+    """
+    Read-only node:rank mapping returned by pagerank(..., return_numpy=True).
+
+    The ranks are held in a float32 NumPy array (``ranks``) aligned with the list of
+    node ids (``ids``), so large results avoid one boxed float per node and can be
+    used directly in vectorized code. The id index behind key lookups is only built
+    on first access.
+    """
+
+    __slots__ = ("ids", "ranks", "_index")
+
+    def __init__(self, ids: List, ranks):
+        self.ids = ids
+        self.ranks = ranks
+        self._index: Optional[Dict[Any, int]] = None
+
+    def __getitem__(self, node):
+        if self._index is None:
+            self._index = {node_id: i for i, node_id in enumerate(self.ids)}
+        return self.ranks[self._index[node]]
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
 
 @configure_if_nx_active()
 def pagerank(
@@ -66,6 +109,7 @@ def pagerank(
     source_nodes: Optional[List] = None,
     source_weights: Optional[List] = None,
     write_property: Optional[str] = None,
+    return_numpy: bool = False,
 ):
     """
     Executes PageRank algorithm on the graph.
@@ -91,13 +135,18 @@ def pagerank(
     :param write_property: Specifies the name of the node property that will store the computed pageRank values.
     For comprehensive usage details,
     refer to: https://docs.aws.amazon.com/neptune-analytics/latest/userguide/page-rank-mutate.html
+    :param return_numpy: Return the ranks as a RankResult backed by a float32 NumPy array
+    instead of a dict, which needs numpy to be installed.
 
     :return: Computation result of pagerank algorithm, or an empty dictionary when `write_property` is specified.
 
     Note: The parameters personalization, nstart, and dangling are not supported
     in the Neptune Analytics implementation and will be ignored if provided.
     """
-    logger.debug(f"nx_neptune.pagerank() with: \nneptune_graph={neptune_graph}")
+    logger.debug("nx_neptune.pagerank() with: \nneptune_graph=%s", neptune_graph)
+
+    if return_numpy and np is None:
+        raise ImportError("pagerank(..., return_numpy=True) requires numpy")
 
     # Process all parameters
     parameters: dict[str, Any] = {}
@@ -170,9 +219,6 @@ def pagerank(
     )
 
     # Execute PageRank algorithm
-    if parameters is None:
-        parameters = {}
-
     if write_property:
         parameters[PARAM_WRITE_PROPERTY] = write_property
         return execute_mutation_query(
@@ -182,13 +228,26 @@ def pagerank(
             pagerank_mutation_query,
         )
 
-    query_str, para_map = pagerank_query(parameters)
+    # A lone node holds all of the rank
+    trivial_result = single_node_result(neptune_graph, 1.0)
+    if trivial_result is not None:
+        if return_numpy:
+            return RankResult(list(trivial_result), np.ones(1, dtype=np.float32))
+        return trivial_result
+
+    if parameters:
+        query_str, para_map = pagerank_query(parameters)
+    else:
+        query_str, para_map = _DEFAULT_PAGERANK_QUERY_STR, {}
     json_result = neptune_graph.execute_call(query_str, para_map)
 
-    # Convert the result to a dictionary of node:pagerank pairs
-    result = {}
-    for item in json_result:
-        node = Node.from_neptune_response(item["n"])
-        result[node.id] = item[RESPONSE_RANK]
+    if return_numpy:
+        ranks = np.fromiter(
+            map(itemgetter(RESPONSE_RANK), json_result),
+            dtype=np.float32,
+            count=len(json_result),
+        )
+        return RankResult(list(map(itemgetter(RESPONSE_NODE_ID), json_result)), ranks)
 
-    return result
+    # Convert the result to a dictionary of node:pagerank pairs
+    return dict(map(itemgetter(RESPONSE_NODE_ID, RESPONSE_RANK), json_result))
@@ -11,10 +11,10 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import logging
+from operator import itemgetter
 from typing import Any, List, Optional
 
 from nx_neptune.algorithms.util import process_unsupported_param
-from nx_neptune.clients import Edge
 from nx_neptune.clients.neptune_constants import (
     PARAM_CONCURRENCY,
     PARAM_EDGE_LABELS,
@@ -25,7 +25,9 @@ from nx_neptune.clients.neptune_constants import (
 )
 from nx_neptune.clients.opencypher_builder import (
     _NODE_FULL_FORM_ID_FUNC_REF,
+    _NODE_FULL_FORM_ID_REF,
     _NODE_REF,
+    _PARENT_FULL_FORM_ID_REF,
     bfs_layers_query,
     bfs_query,
     descendants_at_distance_query,
@@ -87,16 +89,24 @@ def bfs_edges(
         Edges in the breadth-first search starting from `source`.
     """
     logger.debug(
-        f"nx_neptune.bfs_edges() with: \nneptune_graph={neptune_graph}\nsource={source}\n"
-        f"reverse={reverse}\n"
-        f"depth_limit={depth_limit}\n"
-        f"sort_neighbors={sort_neighbors}\n"
-        f"vertex_label={vertex_label}\n"
-        f"edge_labels={edge_labels}\n"
-        f"concurrency={concurrency}"
+        "nx_neptune.bfs_edges() with: \nneptune_graph=%s\nsource=%s\n"
+        "reverse=%s\n"
+        "depth_limit=%s\n"
+        "sort_neighbors=%s\n"
+        "vertex_label=%s\n"
+        "edge_labels=%s\n"
+        "concurrency=%s",
+        neptune_graph,
+        source,
+        reverse,
+        depth_limit,
+        sort_neighbors,
+        vertex_label,
+        edge_labels,
+        concurrency,
     )
 
-    parameters = {}
+    parameters: dict[str, Any] = {}
     # map parameters:
     if depth_limit:
         parameters[PARAM_MAX_DEPTH] = depth_limit
@@ -120,14 +130,15 @@ def bfs_edges(
     )
 
     query_str, para_map = bfs_query(_NODE_REF, {f"id({_NODE_REF})": source}, parameters)
-    json_result = neptune_graph.execute_call(query_str, para_map)
-
-    for json_edge in json_result:
-        edge = Edge.from_neptune_response(json=json_edge)
-        # Neptune returns a result with source node -> source node - skip it
-        if edge.node_src == edge.node_dest:
-            continue
-        yield edge.to_list()
+    json_result = neptune_graph.execute_call_iter(query_str, para_map)
+
+    # bfs_query returns just the parent and node ids, without the source -> source row
+    get_edge_ids = itemgetter(_PARENT_FULL_FORM_ID_REF, _NODE_FULL_FORM_ID_REF)
+    try:
+        for src_id, dest_id in map(get_edge_ids, json_result):
+            yield [str(src_id), str(dest_id)]
+    except KeyError as e:
+        raise ValueError(f"json response missing {e} column", e)
 
 
 @configure_if_nx_active()
@@ -15,7 +15,7 @@ Utility functions for Neptune Analytics algorithms.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from nx_neptune.clients.neptune_constants import RESPONSE_SUCCESS
 from nx_neptune.na_graph import get_config
@@ -23,6 +23,12 @@ from nx_neptune.na_graph import get_config
 logger = logging.getLogger(__name__)
 
 
+_UNSUPPORTED_PARAM_WARNING = (
+    "'{param_name}' parameter is not supported in Neptune Analytics implementation. "
+    "This argument will be ignored and execution will proceed without it."
+)
+
+
 def process_unsupported_param(params: Dict[str, Any]) -> None:
     """
     Process unsupported parameters for Neptune Analytics algorithms.
@@ -30,14 +36,62 @@ def process_unsupported_param(params: Dict[str, Any]) -> None:
 
     :param params: Dictionary with parameter names as keys and parameter values as values
     """
+    # Callers almost always pass nothing but Nones, and the warnings may be filtered
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     for param_name, param_value in params.items():
         if param_value is not None:
             logger.warning(
-                f"'{param_name}' parameter is not supported in Neptune Analytics implementation. "
-                f"This argument will be ignored and execution will proceed without it."
+                _UNSUPPORTED_PARAM_WARNING.format_map({"param_name": param_name})
             )
 
 
+def single_node_result(neptune_graph, value: Any) -> Optional[Dict[Any, Any]]:
+    """
+    Return the NetworkX result for a single-node graph without a round-trip to
+    Neptune Analytics, or None if the algorithm needs to be executed.
+
+    An empty local graph is not short-circuited: it is not synced, so the algorithm
+    runs against whatever data is already loaded into Neptune Analytics. Likewise, a
+    single-node graph only mirrors the remote data when the graph was reset before
+    the sync and nothing was imported from S3.
+
+    :param neptune_graph: A NeptuneGraph instance
+    :param value: Result value of the single node
+    """
+    graph = neptune_graph.graph
+    if graph.number_of_nodes() != 1 or not _mirrors_neptune(graph):
+        return None
+
+    return {node: value for node in graph}
+
+
+def graph_node_count(neptune_graph) -> int:
+    """
+    Return the number of nodes the algorithm runs over. The local count is used when
+    the local graph mirrors the data in Neptune Analytics; otherwise (an empty local
+    graph, an S3 import or a sync without a reset) the nodes are counted in Neptune.
+
+    :param neptune_graph: A NeptuneGraph instance
+    """
+    graph = neptune_graph.graph
+    if _mirrors_neptune(graph):
+        return graph.number_of_nodes()
+    return neptune_graph.count_nodes()
+
+
+def _mirrors_neptune(graph) -> bool:
+    """
+    Whether the local graph holds exactly the data loaded into Neptune Analytics:
+    it is not empty, was reset before the sync and nothing was imported from S3.
+    """
+    if graph.number_of_nodes() == 0:
+        return False
+
+    config = get_config()
+    return not config.skip_graph_reset and config.import_s3_bucket is None
+
+
 def execute_mutation_query(neptune_graph, parameters, algo_name, algo_query_call):
     """
     Responsible to handle the execution flow of mutate variant of Neptune Analytics Algorithm.
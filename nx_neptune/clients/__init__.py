@@ -31,12 +31,14 @@ from .neptune_constants import (
 from .opencypher_builder import (
     bfs_query,
     clear_query,
+    count_nodes,
     delete_edge,
     delete_node,
     insert_edge,
     insert_node,
     match_all_edges,
     match_all_nodes,
+    match_nodes_with_limit,
     pagerank_query,
     update_edge,
     update_node,
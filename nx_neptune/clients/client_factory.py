@@ -10,7 +10,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
 from botocore.client import BaseClient
@@ -27,6 +27,9 @@ from .neptune_constants import (
 
 __all__ = ["ClientFactory"]
 
+_NA_MAX_POOL_CONNECTIONS = 32
+_NA_MAX_ATTEMPTS = 5
+
 
 class ClientFactory:
     """Centralized factory for creating and caching boto3 clients.
@@ -35,7 +38,8 @@ class ClientFactory:
     all AWS service clients used by the library.
 
     When called with no arguments, returns the shared singleton default instance.
-    When called with custom configuration, creates a new instance.
+    When called with custom configuration, returns the instance shared by every
+    caller using that same configuration.
 
     Args:
         region: AWS region name. If None, uses boto3 default.
@@ -44,6 +48,7 @@ class ClientFactory:
     """
 
     _default: Optional["ClientFactory"] = None
+    _configured: Dict[Tuple[Optional[str], Optional[int]], "ClientFactory"] = {}
 
     def __new__(
         cls,
@@ -54,7 +59,12 @@ class ClientFactory:
             if cls._default is None:
                 cls._default = super().__new__(cls)
             return cls._default
-        return super().__new__(cls)
+        # Reuse the factory (and its already-built clients) for a repeated
+        # configuration, so per-call wrappers don't reload boto3 service models
+        key = (region, timeout_seconds)
+        if key not in cls._configured:
+            cls._configured[key] = super().__new__(cls)
+        return cls._configured[key]
 
     def __init__(
         self,
@@ -74,7 +84,14 @@ class ClientFactory:
         return kwargs
 
     def _na_config(self) -> Config:
-        config_kwargs: dict[str, Any] = {"user_agent_appid": APP_ID_NX}
+        # Keep the pooled HTTPS connections alive between the many short queries an
+        # algorithm session issues, instead of re-handshaking after idle periods
+        config_kwargs: dict[str, Any] = {
+            "user_agent_appid": APP_ID_NX,
+            "tcp_keepalive": True,
+            "max_pool_connections": _NA_MAX_POOL_CONNECTIONS,
+            "retries": {"mode": "standard", "max_attempts": _NA_MAX_ATTEMPTS},
+        }
         if self._timeout_seconds:
             config_kwargs["read_timeout"] = self._timeout_seconds
         return Config(**config_kwargs)
@@ -10,8 +10,11 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import concurrent.futures
 import logging
-from typing import Optional, Union
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Optional, Union
 
 import jmespath
 from botocore.client import BaseClient
@@ -23,6 +26,14 @@ __all__ = ["IamClientWrapper", "split_s3_arn_to_bucket_and_path"]
 from .client_factory import ClientFactory
 from .neptune_constants import SERVICE_NA
 
+_PERMISSION_CHECK_WORKERS = 8
+_STS_ASSUME_ACTIONS = frozenset(("sts:AssumeRole", "sts:*"))
+
+# Compiled once; jmespath.search would rebuild the expression AST on every call
+_ALLOW_STATEMENTS = jmespath.compile(
+    "Role.AssumeRolePolicyDocument.Statement[?Effect==`Allow`]"
+)
+
 
 class IamClientWrapper:
     """
@@ -83,26 +94,32 @@ class IamClientWrapper:
             response = self.client.get_role(RoleName=iam_role_arn)  # type: ignore[attr-defined]
 
             # Use jmespath to extract statements that allow AssumeRole for the service
-            statements = jmespath.search(
-                "Role.AssumeRolePolicyDocument.Statement[?Effect==`Allow`]", response
-            )
+            statements = _ALLOW_STATEMENTS.search(response)
 
             if statements is None:
                 raise ValueError(f"Unexpected response structure: {response}")
 
             # Check if the service is allowed to assume this role
             service_principal = f"{service_name}.amazonaws.com"
-            sts_allowed_list = ["sts:AssumeRole", "sts:*"]
             for statement in statements:
                 action = statement.get("Action")
-                # Action can be a string or a list
-                actions = [action] if isinstance(action, str) else action
+                # Action can be a string or a list; test either without copying it
+                if isinstance(action, str):
+                    allows_assume = action in _STS_ASSUME_ACTIONS
+                else:
+                    allows_assume = not _STS_ASSUME_ACTIONS.isdisjoint(action)
 
-                if any(a in sts_allowed_list for a in actions):
+                if allows_assume:
                     # Only check allow at the end.
-                    service = jmespath.search("Principal.Service", statement)
-                    services = [service] if isinstance(service, str) else service
-                    if services and service_principal in services:
+                    principal = statement.get("Principal")
+                    service = (
+                        principal.get("Service")
+                        if isinstance(principal, dict)
+                        else None
+                    )
+                    if isinstance(service, str):
+                        service = (service,)
+                    if service and service_principal in service:
                         return True
             return False
 
@@ -122,31 +139,53 @@ class IamClientWrapper:
         Returns:
             dict: A dictionary mapping each permission to a boolean indicating if it's allowed
 
+        Raises:
+            ValueError: If input parameters are invalid
+            ClientError: If there's an issue with the AWS API call
+        """
+        return self._check_aws_permissions(operation_name, {resource_arn: permissions})
+
+    def _check_aws_permissions(
+        self, operation_name: str, permissions_by_resource: Dict[str, list]
+    ) -> dict:
+        """
+        Validates the permissions needed on several resources with a single
+        policy simulation, each action only being required on the resource(s) it is listed for.
+
+        Args:
+            operation_name (str): Name of the operation being performed (for error messages)
+            permissions_by_resource (dict): Resource ARN to the list of permissions to check on it
+
+        Returns:
+            dict: A dictionary mapping each permission to a boolean indicating if it's allowed
+
         Raises:
             ValueError: If input parameters are invalid
             ClientError: If there's an issue with the AWS API call
         """
         allowed_decisions = ["allowed"]
+        resource_arns = list(permissions_by_resource)
 
         try:
             # Validate ARN formats
-            if resource_arn != "*":
-                self._validate_arns([self.role_arn, resource_arn])
+            specific_arns = [arn for arn in resource_arns if arn != "*"]
+            if specific_arns:
+                self._validate_arns([self.role_arn, *specific_arns])
             self.logger.debug(
                 f"Perform role permission check with: \n"
                 f" Role [{self.role_arn}], \n"
-                f" Permission: [{permissions}]\n"
-                f" Resources: [{resource_arn}]\n"
+                f" Permission: [{permissions_by_resource}]\n"
             )
-            # Execute the permission check
+            # Execute the permission check for the union of the actions
             response = self.client.simulate_principal_policy(  # type: ignore[attr-defined]
                 PolicySourceArn=self.role_arn,
-                ActionNames=permissions,
-                ResourceArns=[resource_arn],
+                ActionNames=list(
+                    dict.fromkeys(chain.from_iterable(permissions_by_resource.values()))
+                ),
+                ResourceArns=resource_arns,
             )
 
-            # Extract evaluation results using jmespath
-            evaluation_results = jmespath.search("EvaluationResults", response)
+            evaluation_results = response.get("EvaluationResults")
 
             # Check if evaluation_results is None or empty
             if not evaluation_results:
@@ -163,14 +202,39 @@ class IamClientWrapper:
                 if not action_name or not decision:
                     raise ValueError(f"Unexpected result structure: {result}")
 
-                if decision not in allowed_decisions:
-                    raise ValueError(
-                        f"Insufficient permission, {action_name} need to be grant for operation {operation_name}"
+                # Every action is simulated against every resource, so only judge it on
+                # the resources it was requested for (e.g. s3:* on the bucket, not the key)
+                resource_decisions = {
+                    specific.get("EvalResourceName"): specific.get(
+                        "EvalResourceDecision"
                     )
+                    for specific in result.get("ResourceSpecificResults") or ()
+                }
+                eval_resource = result.get("EvalResourceName")
+                for (
+                    resource_arn,
+                    resource_permissions,
+                ) in permissions_by_resource.items():
+                    if action_name not in resource_permissions:
+                        continue
+                    if resource_arn in resource_decisions:
+                        resource_decision = resource_decisions[resource_arn]
+                    elif (
+                        eval_resource != resource_arn and eval_resource in resource_arns
+                    ):
+                        # This result reports on another one of the requested resources
+                        continue
+                    else:
+                        resource_decision = decision
+
+                    if resource_decision not in allowed_decisions:
+                        raise ValueError(
+                            f"Insufficient permission, {action_name} need to be grant for operation {operation_name}"
+                        )
                 # Map the decision to a boolean - check against list of allowed decisions
-                results[action_name] = decision in allowed_decisions
+                results[action_name] = True
             self.logger.debug(
-                f"Permission check on resource [{resource_arn}], with result: {results}"
+                f"Permission check on resource(s) {resource_arns}, with result: {results}"
             )
             return results
 
@@ -230,7 +294,8 @@ class IamClientWrapper:
             ValueError: If the role lacks required permissions or cannot be assumed by Neptune Analytics
 
         Note:
-            If key_arn is provided, both S3 and KMS permissions are checked and the results are merged.
+            If key_arn is provided, both S3 and KMS permissions are checked with a single
+            simulate_principal_policy call.
         """
         self.logger.debug(
             f"Permission check on ARN(s): {self.role_arn}, {bucket_arn}, {key_arn}"
@@ -239,12 +304,12 @@ class IamClientWrapper:
         bucket_full_path = _get_s3_in_arn(bucket_arn)
         if not self.check_assume_role(SERVICE_NA):
             raise ValueError(f"Missing role assume on principle {SERVICE_NA}")
-        # Check S3
-        self.check_aws_permission(operation_name, s3_permissions, bucket_full_path)
 
-        # Check KMS
+        # Check S3, and KMS when a key is used, in one policy simulation
+        permissions_by_resource = {bucket_full_path: s3_permissions}
         if key_arn is not None:
-            self.check_aws_permission(operation_name, kms_permissions, key_arn)
+            permissions_by_resource[key_arn] = kms_permissions
+        self._check_aws_permissions(operation_name, permissions_by_resource)
 
     def has_export_to_s3_permissions(self, bucket_arn, key_arn=None):
         """Check if the configured IAM role has permissions to export data to S3.
@@ -490,14 +555,8 @@ class IamClientWrapper:
         arn_list = [arns] if isinstance(arns, str) else arns
 
         # Validate each ARN
-        arn_parser = ArnParser()
         for arn in arn_list:
-            if arn and arn[-1] == "/":
-                raise ValueError(f"Invalid ARN, '{arn}' ended with /")
-            try:
-                arn_parser.parse_arn(arn)
-            except ValueError as e:
-                raise ValueError(f"Invalid ARN format for '{arn}': {e}")
+            _validate_arn(arn)
 
         # All ARNs are valid if we reach here
         return True
@@ -568,8 +627,6 @@ class IamClientWrapper:
             - S3: GetObject (import), PutObject/ListBucket (export)
             - KMS: Decrypt, GenerateDataKey, DescribeKey (for both import/export)
         """
-        results = {}
-
         # Convert s3 bucket urls to arn
         s3_import = (
             _get_s3_in_arn(arn_s3_bucket_import) if arn_s3_bucket_import else None
@@ -685,7 +742,7 @@ class IamClientWrapper:
             ],
         }
 
-        for op, permission_pairs in checks.items():
+        def check_operation(op: str, permission_pairs: list) -> bool:
             for pair in permission_pairs:
                 try:
                     if "arn" in pair and pair["arn"]:
@@ -694,13 +751,41 @@ class IamClientWrapper:
                         self.check_aws_permission(op, pair["permissions"])
                 except Exception as e:
                     self.logger.debug(e)
-                    results[op] = False
-                    break
-                results.setdefault(op, True)
+                    return False
+            return True
+
+        # Each check is a network round-trip to IAM, so overlap them; the worker
+        # count stays below botocore's default connection pool size of 10
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_PERMISSION_CHECK_WORKERS
+        ) as pool:
+            results = dict(
+                zip(checks, pool.map(check_operation, checks, checks.values()))
+            )
 
         return results
 
 
+_ARN_PARSER = ArnParser()
+
+
+@lru_cache(maxsize=128)
+def _validate_arn(arn: str) -> None:
+    """
+    Validates a single ARN. Successful validations are cached, as the same role,
+    bucket and key ARNs are checked again for every permission check.
+
+    Raises:
+        ValueError: If the ARN is invalid, with appropriate description
+    """
+    if arn and arn[-1] == "/":
+        raise ValueError(f"Invalid ARN, '{arn}' ended with /")
+    try:
+        _ARN_PARSER.parse_arn(arn)
+    except ValueError as e:
+        raise ValueError(f"Invalid ARN format for '{arn}': {e}")
+
+
 def split_s3_arn_to_bucket_and_path(s3_arn: str) -> tuple:
     """
     Splits out the s3 arn as a bucket and path
@@ -715,6 +800,7 @@ def split_s3_arn_to_bucket_and_path(s3_arn: str) -> tuple:
     return bucket_name, bucket_path_str
 
 
+@lru_cache(maxsize=256)
 def _get_s3_in_arn(s3_path: str) -> str:
     """
     Converts an S3 path to an ARN format for use in IAM policy evaluation.
@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License.
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import boto3
 from botocore.client import BaseClient
@@ -21,6 +21,16 @@ from botocore.config import Config
 from .client_factory import ClientFactory
 from .neptune_constants import APP_ID_NX, SERVICE_NA
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional dependency for streaming results
+    ijson = None
+
 
 class NeptuneAnalyticsClient:
     """
@@ -149,6 +159,38 @@ class NeptuneAnalyticsClient:
         Returns:
             dict: Result from the Boto client.
         """
+        response = self._send_query(query_string, parameter_map)
+        return _loads_payload(response["payload"].read())["results"]
+
+    def execute_generic_query_iter(
+        self, query_string: str, parameter_map: Optional[dict] = None
+    ) -> Iterator[Any]:
+        """
+        Execute an OpenCypher query and yield the result rows one at a time.
+
+        When ijson is installed the rows are parsed incrementally from the
+        response stream, so a large result set is never held in memory as a
+        whole; otherwise the payload is decoded in one go as in
+        execute_generic_query. The query is sent on the first iteration.
+
+        Args:
+            query_string (str): OpenCypher query in string format.
+            parameter_map (dict, optional): Parameter map for parameterized queries. Defaults to None.
+
+        Yields:
+            Any: One entry of the query results at a time.
+        """
+        response = self._send_query(query_string, parameter_map)
+        payload = response["payload"]
+        try:
+            if ijson is None:
+                yield from _loads_payload(payload.read())["results"]
+            else:
+                yield from ijson.items(payload, "results.item", use_float=True)
+        finally:
+            payload.close()
+
+    def _send_query(self, query_string: str, parameter_map: Optional[dict] = None):
         query_params: dict = {
             "graphIdentifier": self.graph_id,
             "queryString": query_string,
@@ -167,6 +209,19 @@ class NeptuneAnalyticsClient:
         self.logger.debug(
             f"Executing generic query [{query_string}] on graph [{self.graph_id}]"
         )
-        response = self.client.execute_query(**query_params)  # type: ignore[attr-defined]
+        return self.client.execute_query(**query_params)  # type: ignore[attr-defined]
 
-        return json.loads(response["payload"].read())["results"]
+
+def _loads_payload(payload: bytes) -> Any:
+    """
+    Decode a query response payload, with orjson when it is installed.
+
+    orjson is strict RFC 8259 and rejects NaN/Infinity literals and integers
+    wider than 64 bits, so such payloads fall back to the standard library.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(payload)
@@ -15,6 +15,7 @@ __all__ = [
     "Edge",
 ]
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Union
 
@@ -34,6 +35,10 @@ class Node:
         properties (dict): A dictionary of properties for the node
     """
 
+    # Nodes are created per row when converting graphs and results, so skip the
+    # per-instance __dict__
+    __slots__ = ("id", "labels", "properties")
+
     def __init__(self, id, labels=None, properties=None):
         self.id = str(id)
         self.labels = labels if labels else []
@@ -55,9 +60,12 @@ class Node:
 
     @classmethod
     def from_neptune_response(cls, json: Dict):
+        labels = json.get("~labels")
         return cls(
             id=json.get("~id"),
-            labels=json.get("~labels"),
+            # Every decoded row carries its own copy of the label strings; intern
+            # them so a large result holds one string per distinct label
+            labels=list(map(sys.intern, labels)) if labels else labels,
             properties=json.get("~properties"),
         )
 
@@ -65,9 +73,7 @@ class Node:
         """
         Convert node to a Dict with in the format that is compatible with UNWIND operation.
         """
-        node_in_dict = self.properties.copy()
-        node_in_dict["id"] = self.id
-        return node_in_dict
+        return {**self.properties, "id": self.id}
 
     def to_group_by(self) -> tuple:
         """
@@ -86,6 +92,13 @@ class Node:
             return False
         return self.id == other.id
 
+    def __hash__(self):
+        """
+        Hash a Node by its id, consistent with ``__eq__``, so nodes can be
+        de-duplicated with sets and dicts
+        """
+        return hash(self.id)
+
     def __repr__(self):
         return f"Node(id={self.id}, labels={self.labels}, properties={self.properties})"
 
@@ -128,6 +141,8 @@ class Edge:
         ... )
     """
 
+    __slots__ = ("node_src", "node_dest", "label", "properties", "is_directed")
+
     def __init__(
         self, node_src, node_dest, label=None, properties=None, is_directed=True
     ):
@@ -202,13 +217,29 @@ class Edge:
         except KeyError as e:
             raise ValueError(f'json response missing "{dest_node_label}" node', e)
 
-        return cls(
+        return cls._unchecked(
             Node.from_neptune_response(parent_node),
             Node.from_neptune_response(child_node),
         )
 
+    @classmethod
+    def _unchecked(
+        cls, node_src, node_dest, label="", properties=None, is_directed=True
+    ):
+        """
+        Build an Edge without validating its nodes, for internal paths that already
+        hold two Node objects (response decoding, reversal).
+        """
+        edge = cls.__new__(cls)
+        edge.node_src = node_src
+        edge.node_dest = node_dest
+        edge.label = label
+        edge.properties = properties if properties else {}
+        edge.is_directed = is_directed
+        return edge
+
     def to_reverse_edge(self):
-        return Edge(
+        return Edge._unchecked(
             self.node_dest,
             self.node_src,
             label=self.label,
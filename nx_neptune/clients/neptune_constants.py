@@ -63,6 +63,7 @@ PARAM_ITERATION_TOLERANCE = "iterationTolerance"
 RESPONSE_RANK = "rank"
 RESPONSE_DEGREE = "degree"
 RESPONSE_ID = "n.id"
+RESPONSE_NODE_ID = "nodeId"
 RESPONSE_SUCCESS = "success"
 
 # Misc
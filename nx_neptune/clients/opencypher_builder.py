@@ -11,6 +11,10 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Dict, List, Optional, Tuple
 
 from cymple import QueryBuilder
@@ -33,6 +37,8 @@ _NODE_FULL_FORM_REF = "node"
 _NODE_FULL_FORM_ID_REF = "nodeId"
 _NODE_FULL_FORM_ID_FUNC_REF = f"id({_NODE_FULL_FORM_REF})"
 _PARENT_FULL_FORM_REF = "parent"
+_PARENT_FULL_FORM_ID_REF = "parentId"
+_PARENT_FULL_FORM_ID_FUNC_REF = f"id({_PARENT_FULL_FORM_REF})"
 _BFS_PARENTS_ALG = "neptune.algo.bfs.parents"
 _BFS_LEVELS_ALG = "neptune.algo.bfs.levels"
 _PAGE_RANK_ALG = "neptune.algo.pageRank"
@@ -47,10 +53,19 @@ _LOUVAIN_ALG = "neptune.algo.louvain"
 _LOUVAIN_MUTATE_ALG = "neptune.algo.louvain.mutate"
 _RANK_REF = "rank"
 _DEGREE_REF = "degree"
+_COUNT_REF = "count"
 _COMMUNITY_REF = "community"
+_SCALE_PARAM = "scale"
+_ID_PROPERTY = "`~id`"
+
+# Query hint so repeated algorithm calls reuse the cached plan instead of re-planning
+_PLAN_CACHE_HINT = 'USING QUERY:PLANCACHE "enabled"'
+
 
 __all__ = [
     "match_all_nodes",
+    "match_nodes_with_limit",
+    "count_nodes",
     "match_all_edges",
     "insert_node",
     "insert_edge",
@@ -79,13 +94,42 @@ def _to_parameter_list(parameters: Dict[str, Any]) -> str:
         return ""
 
     return ", ".join(
-        [
-            f'{key}:"{value}"' if isinstance(value, str) else f"{key}:{value}"
-            for key, value in parameters.items()
-        ]
+        f'{key}:"{value}"' if isinstance(value, str) else f"{key}:{value}"
+        for key, value in parameters.items()
     )
 
 
+# Parameter names and placeholders are the same for every query, so they are
+# formatted once and shared instead of rebuilt per property
+_PARAM_NAMES: List[str] = []
+_PLACEHOLDERS: List[str] = []
+_PARAM_NAMES_LOCK = threading.Lock()
+
+
+def _grow_param_names(size: int) -> None:
+    with _PARAM_NAMES_LOCK:
+        for index in range(len(_PARAM_NAMES), size):
+            _PARAM_NAMES.append(str(index))
+            _PLACEHOLDERS.append(f"${index}")
+
+
+def _procedure_args(source: Optional[str], parameters: Optional[Dict[str, Any]]) -> str:
+    """
+    Build the argument list of an algorithm CALL: the source variable, the inlined
+    options map, or both.
+
+    Example:
+        >>> _procedure_args('n', {'maxDepth': 3})
+        'n, {maxDepth:3}'
+        >>> _procedure_args(None, {'writeProperty': 'rank'})
+        '{writeProperty:"rank"}'
+    """
+    if not parameters:
+        return source or ""
+    options = f"{{{_to_parameter_list(parameters)}}}"
+    return f"{source}, {options}" if source else options
+
+
 class ParameterMapBuilder:
     """
     A utility class for building parameter maps for OpenCypher queries.
@@ -96,6 +140,9 @@ class ParameterMapBuilder:
     with get_param_values().
     """
 
+    # One builder is created per query, so skip the per-instance __dict__
+    __slots__ = ("_counter", "_param_values")
+
     def __init__(self):
         """Initialize the parameter map builder with a counter starting at 0."""
         self._counter = 0
@@ -116,15 +163,9 @@ class ParameterMapBuilder:
             return {}
 
         # handle a map of values
-        masked_params = {}
-        for key, value in params.items():
-            param_name = str(self._counter)
-            masked_param_name = f"${param_name}"
-            masked_params[key] = masked_param_name
-            self._param_values[param_name] = value
-            self._counter += 1
-
-        return masked_params
+        param_names, placeholders = self._reserve(len(params))
+        self._param_values.update(zip(param_names, params.values()))
+        return dict(zip(params, placeholders))
 
     def read_list(self, params: Optional[List[Any]] = None) -> List[str]:
         """
@@ -141,14 +182,25 @@ class ParameterMapBuilder:
             return []
 
         # handle a list of values
-        masked_params = []
-        for value in params:
-            masked_param_name = f"${self._counter}"
-            masked_params.append(masked_param_name)
-            self._param_values[str(self._counter)] = value
-            self._counter += 1
+        param_names, placeholders = self._reserve(len(params))
+        self._param_values.update(zip(param_names, params))
+        return placeholders
+
+    def _reserve(self, count: int) -> Tuple[List[str], List[str]]:
+        """
+        Claim the next ``count`` parameter slots.
 
-        return masked_params
+        Returns:
+            The parameter names ("0", "1", ...) and their placeholders ("$0", "$1", ...)
+        """
+        start = self._counter
+        self._counter += count
+        if len(_PLACEHOLDERS) < self._counter:
+            _grow_param_names(self._counter)
+        return (
+            _PARAM_NAMES[start : self._counter],
+            _PLACEHOLDERS[start : self._counter],
+        )
 
     def get_param_values(self) -> Dict[str, Any]:
         """
@@ -160,6 +212,12 @@ class ParameterMapBuilder:
         return self._param_values
 
 
+# Queries with no inputs are built once at import time
+_MATCH_ALL_NODES_QUERY = (
+    QueryBuilder().match().node(ref_name=_NODE_REF).return_literal(_NODE_REF).query
+)
+
+
 def match_all_nodes() -> str:
     """
     Create a query to match all nodes in the graph.
@@ -170,11 +228,67 @@ def match_all_nodes() -> str:
         >>> match_all_nodes()
         'MATCH (n) RETURN n'
     """
+    return _MATCH_ALL_NODES_QUERY
+
+
+def match_nodes_with_limit(limit: int) -> str:
+    """
+    Create a query to match at most ``limit`` nodes in the graph.
+
+    :param limit: Maximum number of nodes to return
+    :return: OpenCypher query string for matching a bounded set of nodes
+    :raises ValueError: If limit is not a non-negative integer.
+
+    Example:
+        >>> match_nodes_with_limit(10)
+        'MATCH (n) RETURN n LIMIT 10'
+    """
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+        raise ValueError(f"Invalid limit: {limit!r}")
+
     return (
-        QueryBuilder().match().node(ref_name=_NODE_REF).return_literal(_NODE_REF).query
+        QueryBuilder()
+        .match()
+        .node(ref_name=_NODE_REF)
+        .return_literal(_NODE_REF)
+        .limit(limit)
+        .query
     )
 
 
+_COUNT_NODES_QUERY = (
+    QueryBuilder()
+    .match()
+    .node(ref_name=_NODE_REF)
+    .return_literal(f"count({_NODE_REF}) AS {_COUNT_REF}")
+    .query
+)
+
+
+def count_nodes() -> str:
+    """
+    Create a query to count the nodes in the graph.
+
+    :return: OpenCypher query string for counting all nodes
+
+    Example:
+        >>> count_nodes()
+        'MATCH (n) RETURN count(n) AS count'
+    """
+    return _COUNT_NODES_QUERY
+
+
+_MATCH_ALL_EDGES_QUERY = (
+    QueryBuilder()
+    .match()
+    .node(ref_name=_SRC_NODE_REF)
+    .related_to(ref_name=_RELATION_REF)
+    .node(ref_name=_DEST_NODE_REF)
+    .return_literal(_RELATION_REF)
+    .query
+)
+
+
 def match_all_edges() -> str:
     """
     Create a query to match all edges (relationships) in the graph.
@@ -185,15 +299,7 @@ def match_all_edges() -> str:
         >>> match_all_edges()
         'MATCH (a)-[r]->(b) RETURN r'
     """
-    return (
-        QueryBuilder()
-        .match()
-        .node(ref_name=_SRC_NODE_REF)
-        .related_to(ref_name=_RELATION_REF)
-        .node(ref_name=_DEST_NODE_REF)
-        .return_literal(_RELATION_REF)
-        .query
-    )
+    return _MATCH_ALL_EDGES_QUERY
 
 
 def insert_node(node: Node) -> Tuple[str, Dict[str, Any]]:
@@ -208,24 +314,9 @@ def insert_node(node: Node) -> Tuple[str, Dict[str, Any]]:
         >>> insert_node(node)
         ('CREATE (:Person {'~id': $0, age: $1})', {'0': 'Alice', '1': '15'})
     """
-    # Initialize parameter map builder
-    param_builder = ParameterMapBuilder()
-
-    updated_parameters = node.properties
-    updated_parameters["`~id`"] = str(node.id)
-
-    # Mask node properties
-    masked_properties = param_builder.read_map(updated_parameters)
-
-    return (
-        QueryBuilder()
-        .create()
-        .node(
-            labels=node.labels,
-            properties=masked_properties,
-            escape=False,
-        )
-    ).query, param_builder.get_param_values()
+    properties = _with_id(node)
+    query_str = _insert_node_template(_node_shape(node.labels, properties))
+    return query_str, _bind_values(properties.values())
 
 
 def insert_nodes(nodes: List[Node]) -> Tuple[List[str], List[Dict[str, Any]]]:
@@ -237,11 +328,10 @@ def insert_nodes(nodes: List[Node]) -> Tuple[List[str], List[Dict[str, Any]]]:
 
     """
 
-    group_by_buckets: dict[tuple, list] = {}
+    group_by_buckets: defaultdict[tuple, list] = defaultdict(list)
 
     for node in nodes:
-        group_by_key = node.to_group_by()
-        group_by_buckets.setdefault(group_by_key, []).append(node.to_dict())
+        group_by_buckets[tuple(node.labels)].append(node.to_dict())
 
     query_list = []
     para_list = []
@@ -269,44 +359,36 @@ def insert_edge(edge: Edge) -> Tuple[str, Dict[str, Any]]:
         ('MERGE (a:Person {`~id`: $0}) MERGE (b:Person {`~id`: $1})
         MERGE (a)-[r:FRIEND_WITH {since: $2}]->(b)', {'0': 'Alice', '1': 'Bob', '2': '2020'})
     """
-    # Initialize parameter map builder
-    param_builder = ParameterMapBuilder()
+    src_properties = _with_id(edge.node_src)
+    dest_properties = _with_id(edge.node_dest)
+    query_str = _insert_edge_template(
+        _node_shape(edge.node_src.labels, src_properties),
+        _node_shape(edge.node_dest.labels, dest_properties),
+        edge.label,
+        tuple(edge.properties),
+        edge.is_directed,
+    )
+    return query_str, _bind_values(
+        src_properties.values(),
+        dest_properties.values(),
+        edge.properties.values(),
+    )
 
-    qb = QueryBuilder()
-    qb = _append_node(qb, param_builder, edge.node_src, _SRC_NODE_REF, True)
-    qb = _append_node(qb, param_builder, edge.node_dest, _DEST_NODE_REF, True)
-    masked_properties = param_builder.read_map(edge.properties)
-    qb = qb.merge().node(ref_name=_SRC_NODE_REF)
-    if edge.is_directed:
-        qb = qb.related_to(
-            label=edge.label,
-            ref_name=_RELATION_REF,
-            properties=masked_properties,
-            escape=False,
-        ).node(ref_name=_DEST_NODE_REF)
-    else:
-        qb = qb.related(
-            label=edge.label,
-            ref_name=_RELATION_REF,
-            properties=masked_properties,
-            escape=False,
-        ).node(ref_name=_DEST_NODE_REF)
 
-    return qb.query, param_builder.get_param_values()
+@lru_cache(maxsize=512)
+def _unwind_labels(labels: Tuple[str, ...]) -> str:
+    """
+    Render a label tuple as the ":A:B" fragment used by the UNWIND batch queries.
+    """
+    return ":" + ":".join(labels) if labels else ""
 
 
+# Batches of the same schema recur across calls, so the text is rendered once per key
+@lru_cache(maxsize=256)
 def get_edge_batch_query_str(group_by_key: ImmutableEdgeGroupBy):
     # TODO: Replace with cymple when it provide wider support of UNWIND.
-    src_labels = (
-        ":" + ":".join(group_by_key.labels_src_node)
-        if group_by_key.labels_src_node
-        else ""
-    )
-    dest_labels = (
-        ":" + ":".join(group_by_key.labels_dest_node)
-        if group_by_key.labels_dest_node
-        else ""
-    )
+    src_labels = _unwind_labels(group_by_key.labels_src_node)
+    dest_labels = _unwind_labels(group_by_key.labels_dest_node)
 
     if group_by_key.directed:
         return (
@@ -321,9 +403,10 @@ def get_edge_batch_query_str(group_by_key: ImmutableEdgeGroupBy):
         )
 
 
+@lru_cache(maxsize=256)
 def get_node_batch_query_str(labels_tuple):
     # TODO: Replace with cymple when it provide wider support of UNWIND.
-    labels = ":" + ":".join(labels_tuple) if labels_tuple else ""
+    labels = _unwind_labels(labels_tuple)
 
     return f"UNWIND $nodes as node CREATE (n{labels} {{`~id`: node.id}}) SET n += node"
 
@@ -336,17 +419,25 @@ def insert_edges(edges: List[Edge]) -> Tuple[List[str], List[Dict[str, Any]]]:
     :return: Tuple of (OpenCypher query string, parameter map) for edge creation
 
     """
-    group_by_buckets: dict[ImmutableEdgeGroupBy, list] = {}
+    # Bucket on a plain tuple and build the frozen group-by key once per bucket,
+    # rather than constructing an ImmutableEdgeGroupBy for every edge
+    group_by_buckets: defaultdict[tuple, list] = defaultdict(list)
 
     for edge in edges:
-        group_by_key = edge.to_group_by()
-        group_by_buckets.setdefault(group_by_key, []).append(edge.to_dict())
+        group_by_buckets[
+            (
+                tuple(edge.node_src.labels),
+                tuple(edge.node_dest.labels),
+                edge.label,
+                edge.is_directed,
+            )
+        ].append(edge.to_dict())
 
     query_list = []
     para_list = []
 
     for key, value in group_by_buckets.items():
-        query_list.append(get_edge_batch_query_str(key))
+        query_list.append(get_edge_batch_query_str(ImmutableEdgeGroupBy(*key)))
         para_list.append({"relations": value})
 
     return query_list, para_list
@@ -363,17 +454,26 @@ def update_node(
     :param node_ids: list of node IDs to match by
     :param properties_set: Properties to set
     :return: Tuple of (OpenCypher query string, parameter map) for node update
+    :raises ValueError: If node_ids or properties_set is empty.
 
     Example:
         >>> update_node('Person', 'a', ['Alice'], {'a.age': '25'})
         ('MATCH (a:Person) WHERE id(a) = $0 SET a.age = $1', {'0': 'Alice', '1': '25'})
     """
+    # Without ids or properties the WHERE/SET clause would be empty and the
+    # query rejected by the server, so fail before any of it is built
+    if not node_ids:
+        raise ValueError("update_node requires at least one node id")
+    if not properties_set:
+        raise ValueError("update_node requires at least one property to set")
+
     # Initialize parameter map builder
     param_builder = ParameterMapBuilder()
 
     masked_node_ids = param_builder.read_list(node_ids)
+    id_prefix = f"id({ref_name})="
     literal_where_clause = " OR ".join(
-        [f"id({ref_name})={node_id}" for node_id in masked_node_ids]
+        id_prefix + node_id for node_id in masked_node_ids
     )
     masked_properties_set = param_builder.read_map(properties_set)
 
@@ -419,21 +519,24 @@ def update_edge(
     # Initialize parameter map builder
     param_builder = ParameterMapBuilder()
 
-    qb = QueryBuilder().match()
-    qb = _append_node(qb, param_builder, edge.node_src, ref_name_src)
-    if edge.is_directed:
-        qb = qb.related_to(label=edge.label, ref_name=ref_name_edge)
-    else:
-        qb = qb.relates(label=edge.label, ref_name=ref_name_edge)
-    qb = _append_node(qb, param_builder, edge.node_dest, ref_name_des)
-
-    masked_where_filters = param_builder.read_map(where_filters)
-    masked_properties_set = param_builder.read_map(properties_set)
-    qb = qb.where_multiple(masked_where_filters, escape=False).set(
-        masked_properties_set, escape_values=False
+    src_str = _render_node(
+        ref_name_src,
+        edge.node_src.labels,
+        param_builder.read_map(_with_id(edge.node_src)),
+    )
+    relation_str = _render_relation(ref_name_edge, edge.label, {}, edge.is_directed)
+    dest_str = _render_node(
+        ref_name_des,
+        edge.node_dest.labels,
+        param_builder.read_map(_with_id(edge.node_dest)),
     )
+    where_str = _render_assignments(param_builder.read_map(where_filters), " AND ")
+    set_str = _render_assignments(param_builder.read_map(properties_set), ", ")
 
-    return qb.query, param_builder.get_param_values()
+    return (
+        f" MATCH {src_str}{relation_str}{dest_str} WHERE {where_str} SET {set_str}",
+        param_builder.get_param_values(),
+    )
 
 
 def delete_node(node: Node) -> Tuple[str, Dict[str, Any]]:
@@ -448,14 +551,9 @@ def delete_node(node: Node) -> Tuple[str, Dict[str, Any]]:
         >>> delete_node(node)
         ('MATCH (n:Person {`~id`: $0}) DELETE n', {'0': 'Alice'})
     """
-    # Initialize parameter map builder
-    param_builder = ParameterMapBuilder()
-
-    qb = QueryBuilder().match()
-    qb = _append_node(qb, param_builder, node, _NODE_REF)
-    qb = qb.delete(ref_name=_NODE_REF)
-
-    return qb.query, param_builder.get_param_values()
+    properties = _with_id(node)
+    query_str = _delete_node_template(_node_shape(node.labels, properties))
+    return query_str, _bind_values(properties.values())
 
 
 def delete_edge(edge: Edge) -> Tuple[str, Dict[str, Any]]:
@@ -472,19 +570,24 @@ def delete_edge(edge: Edge) -> Tuple[str, Dict[str, Any]]:
         >>> delete_edge(edge)
         ('MATCH (a:Person {name: $0})-[r:FRIEND_WITH]->(b:Person {name: $1}) DELETE r', {'0': 'Alice', '1': 'Bob'})
     """
-    # Initialize parameter map builder
-    param_builder = ParameterMapBuilder()
+    src_properties = _with_id(edge.node_src)
+    dest_properties = _with_id(edge.node_dest)
+    query_str = _delete_edge_template(
+        _node_shape(edge.node_src.labels, src_properties),
+        _node_shape(edge.node_dest.labels, dest_properties),
+        edge.label,
+        edge.is_directed,
+    )
+    return query_str, _bind_values(src_properties.values(), dest_properties.values())
 
-    qb = QueryBuilder().match()
-    qb = _append_node(qb, param_builder, edge.node_src, _SRC_NODE_REF)
-    if edge.is_directed:
-        qb = qb.related_to(label=edge.label, ref_name=_RELATION_REF)
-    else:
-        qb = qb.relates(label=edge.label, ref_name=_RELATION_REF)
-    qb = _append_node(qb, param_builder, edge.node_dest, _DEST_NODE_REF)
-    qb = qb.delete(ref_name=_RELATION_REF)
 
-    return qb.query, param_builder.get_param_values()
+_CLEAR_QUERY = (
+    QueryBuilder()
+    .match()
+    .node(ref_name=_NODE_REF)
+    .detach_delete(ref_name=_NODE_REF)
+    .query
+)
 
 
 def clear_query() -> str:
@@ -497,13 +600,16 @@ def clear_query() -> str:
         >>> clear_query()
         'MATCH (n) DETACH DELETE n'
     """
-    return (
-        QueryBuilder()
-        .match()
-        .node(ref_name=_NODE_REF)
-        .detach_delete(ref_name=_NODE_REF)
-        .query
-    )
+    return _CLEAR_QUERY
+
+
+_BFS_SKIP_SOURCE_FILTER = (
+    f"{_NODE_FULL_FORM_ID_FUNC_REF} <> {_PARENT_FULL_FORM_ID_FUNC_REF}"
+)
+_BFS_RETURN_MAPPING = [
+    (_PARENT_FULL_FORM_ID_FUNC_REF, _PARENT_FULL_FORM_ID_REF),
+    (_NODE_FULL_FORM_ID_FUNC_REF, _NODE_FULL_FORM_ID_REF),
+]
 
 
 def bfs_query(
@@ -520,21 +626,33 @@ def bfs_query(
 
     Example:
         >>> bfs_query('n', {'n.name': 'Alice'})
-        ('MATCH (n) WHERE n.name = $0 CALL neptune.algo.bfs.parent(n)
-        YIELD parent as parent, node as node RETURN parent, node', {'0': 'Alice'})
+        ('USING QUERY:PLANCACHE "enabled" MATCH (n) WHERE n.name = $0 CALL neptune.algo.bfs.parent(n)
+        YIELD parent as parent, node as node WHERE id(node) <> id(parent)
+        RETURN id(parent) AS parentId, id(node) AS nodeId', {'0': 'Alice'})
         >>> bfs_query('n', {'n.name': 'Alice'}, {'maxDepth': 3})
-        ('MATCH (n) WHERE n.name = $0 CALL neptune.algo.bfs.parent(n, {maxDepth:3})
-        YIELD parent as parent, node as node RETURN parent, node', {'0': 'Alice'})
+        ('USING QUERY:PLANCACHE "enabled" MATCH (n) WHERE n.name = $0 CALL neptune.algo.bfs.parent(n, {maxDepth:3})
+        YIELD parent as parent, node as node WHERE id(node) <> id(parent)
+        RETURN id(parent) AS parentId, id(node) AS nodeId', {'0': 'Alice'})
     """
     # Initialize parameter map builder
     param_builder = ParameterMapBuilder()
+    param_builder.read_map(where_filters)
+
+    query_str = _bfs_query_text(
+        source_node,
+        tuple(where_filters or ()),
+        _procedure_args(source_node, parameters),
+    )
+    return query_str, param_builder.get_param_values()
 
-    masked_where_filters = param_builder.read_map(where_filters)
 
-    bfs_params = f"{source_node}"
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        bfs_params = f"{bfs_params}, {{{parameters_list_str}}}"
+# Only the filter values change between traversals from different sources, so the
+# text is built once per (source ref, filter keys, options) and the values re-bound
+@lru_cache(maxsize=128)
+def _bfs_query_text(
+    source_node: str, where_keys: Tuple[str, ...], bfs_params: str
+) -> str:
+    masked_where_filters = ParameterMapBuilder().read_map(dict.fromkeys(where_keys))
 
     # for a query that returns the source and node for each traversal
     query_str = (
@@ -550,10 +668,12 @@ def bfs_query(
                 (_NODE_FULL_FORM_REF, _NODE_FULL_FORM_REF),
             ]
         )
-        .return_literal(f"{_PARENT_FULL_FORM_REF}, {_NODE_FULL_FORM_REF}")
+        # The source is reported as its own parent; drop that row on the server
+        .where_literal(_BFS_SKIP_SOURCE_FILTER)
+        .return_mapping(_BFS_RETURN_MAPPING)
         .query
     )
-    return query_str, param_builder.get_param_values()
+    return _PLAN_CACHE_HINT + query_str
 
 
 def descendants_at_distance_query(
@@ -580,10 +700,7 @@ def descendants_at_distance_query(
 
     masked_where_filters = param_builder.read_map(where_filters)
 
-    distance_params = f"{source_node}"
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        distance_params = f"{distance_params}, {{{parameters_list_str}}}"
+    distance_params = _procedure_args(source_node, parameters)
 
     query_str = (
         QueryBuilder()
@@ -627,10 +744,7 @@ def bfs_layers_query(
 
     masked_where_filters = param_builder.read_map(where_in_filters)
 
-    bfs_params = f"{source_node}"
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        bfs_params = f"{bfs_params}, {{{parameters_list_str}}}"
+    bfs_params = _procedure_args(source_node, parameters)
 
     query_str = (
         QueryBuilder()
@@ -662,25 +776,34 @@ def pagerank_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
 
     Example:
         >>> pagerank_query()
-        (' MATCH (n) CALL neptune.algo.pageRank(n ) YIELD rank AS rank RETURN n, rank', {})
+        ('USING QUERY:PLANCACHE "enabled" MATCH (n) CALL neptune.algo.pageRank(n)
+        YIELD rank AS rank RETURN id(n) AS nodeId, rank AS rank', {})
         >>> pagerank_query({'dampingFactor': 0.9, 'maxIterations': 50})
-        (' MATCH (n) CALL neptune.algo.pageRank(n, {dampingFactor:0.9, maxIterations:50 } )
-        YIELD rank AS rank RETURN n, rank', {})
+        ('USING QUERY:PLANCACHE "enabled" MATCH (n) CALL neptune.algo.pageRank(n, {dampingFactor:0.9, maxIterations:50 } )
+        YIELD rank AS rank RETURN id(n) AS nodeId, rank AS rank', {})
     """
-    pagerank_params = f"{_NODE_REF}"
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        pagerank_params = f"{pagerank_params}, {{{parameters_list_str}}}"
-    return (
+    return _pagerank_query_text(_procedure_args(_NODE_REF, parameters)), {}
+
+
+# The text only varies with the rendered options, which repeat across calls (most
+# calls pass none), so each distinct argument list is built through cymple once
+@lru_cache(maxsize=128)
+def _pagerank_query_text(pagerank_params: str) -> str:
+    return _PLAN_CACHE_HINT + (
         QueryBuilder()
         .match()
         .node(ref_name=_NODE_REF)
         .call()
         .procedure(f"{_PAGE_RANK_ALG}({pagerank_params})")
         .yield_((_RANK_REF, _RANK_REF))
-        .return_literal(_NODE_REF + ", " + _RANK_REF)
+        .return_mapping(
+            [
+                (f"id({_NODE_REF})", _NODE_FULL_FORM_ID_REF),
+                (_RANK_REF, _RANK_REF),
+            ]
+        )
         .query
-    ), {}
+    )
 
 
 def pagerank_mutation_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
@@ -694,9 +817,7 @@ def pagerank_mutation_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
         >>> pagerank_mutation_query()
         (' CALL neptune.algo.pageRank.mutate({ write_property:"pageRank"}) YIELD success AS success RETURN success)')
     """
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        pagerank_params = f"{{{parameters_list_str}}}"
+    pagerank_params = _procedure_args(None, parameters)
     return (
         QueryBuilder()
         .match()
@@ -726,10 +847,7 @@ def label_propagation_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
         YIELD node AS node, community AS community WITH community, id(node) AS nodeId
         RETURN community AS community, collect(nodeId) AS members', {})
     """
-    params = f"{_NODE_REF}"
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        params = f"{params}, {{{parameters_list_str}}}"
+    params = _procedure_args(_NODE_REF, parameters)
     return (
         QueryBuilder()
         .match()
@@ -772,10 +890,7 @@ def louvain_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
         YIELD node AS node, community AS community WITH community, id(node) AS nodeId
         RETURN community AS community, collect(nodeId) AS members', {})
     """
-    params = f"{_NODE_REF}"
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        params = f"{params}, {{{parameters_list_str}}}"
+    params = _procedure_args(_NODE_REF, parameters)
     return (
         QueryBuilder()
         .match()
@@ -816,9 +931,7 @@ def louvain_mutation_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
         (' CALL neptune.algo.louvain.mutate({writeProperty:"community_id", iterationTolerance:1e-07 })
         YIELD success AS success RETURN success', {})
     """
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        params = f"{{{parameters_list_str}}}"
+    params = _procedure_args(None, parameters)
     return (
         QueryBuilder()
         .call()
@@ -844,9 +957,7 @@ def label_propagation_mutation_query(parameters=None) -> Tuple[str, Dict[str, An
         (' CALL neptune.algo.labelPropagation.mutate({writeProperty:"degree", 'maxIterations': 50})
         YIELD success AS success RETURN success', {})
     """
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        params = f"{{{parameters_list_str}}}"
+    params = _procedure_args(None, parameters)
     return (
         QueryBuilder()
         .call()
@@ -876,15 +987,12 @@ def closeness_centrality_query(
     """
 
     if source_nodes:
-        params = _get_nodes_in_list(source_nodes)
+        source = _get_nodes_in_list(source_nodes)
         qb = QueryBuilder()
     else:
-        params = f"{_NODE_REF}"
+        source = _NODE_REF
         qb = QueryBuilder().match().node(ref_name=_NODE_REF)
-
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        params = f"{params}, {{{parameters_list_str}}}"
+    params = _procedure_args(source, parameters)
 
     return (
         qb.call()
@@ -920,9 +1028,7 @@ def closeness_centrality_mutation_query(parameters=None) -> Tuple[str, Dict[str,
         (' CALL neptune.algo.closenessCentrality.mutate({writeProperty:"community_id" })
         YIELD success AS success RETURN success', {})
     """
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        params = f"{{{parameters_list_str}}}"
+    params = _procedure_args(None, parameters)
     return (
         QueryBuilder()
         .call()
@@ -933,31 +1039,48 @@ def closeness_centrality_mutation_query(parameters=None) -> Tuple[str, Dict[str,
     ), {}
 
 
-def degree_centrality_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
+def degree_centrality_query(
+    parameters=None, scale: Optional[float] = None
+) -> Tuple[str, Dict[str, Any]]:
     """
     Create a query to execute the Degree algorithm on Neptune Analytics.
 
     :param parameters: Optional dictionary of algorithm parameters to pass to Degree Centrality algorithm execution
+    :param scale: Optional factor Neptune multiplies each degree by before returning it,
+    passed as a query parameter so the query text (and its cached plan) stays the same
     :return: Tuple of (OpenCypher query string, parameter map) for Degree Centrality algorithm execution
 
     Example:
         >>> degree_centrality_query()
-        (' MATCH(n) CALL neptune.algo.degree(n) YIELD degree AS degree RETURN n.id , degree', {})
+        ('USING QUERY:PLANCACHE "enabled" MATCH(n) CALL neptune.algo.degree(n)
+        YIELD degree AS degree RETURN n.id , degree', {})
+        >>> degree_centrality_query(scale=0.5)
+        ('USING QUERY:PLANCACHE "enabled" MATCH(n) CALL neptune.algo.degree(n)
+        YIELD degree AS degree RETURN n.id , degree * $scale AS degree', {'scale': 0.5})
     """
-    degree_params = f"{_NODE_REF}"
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        degree_params = f"{degree_params}, {{{parameters_list_str}}}"
-    return (
+    query_str = _degree_query_text(
+        _procedure_args(_NODE_REF, parameters), scale is not None
+    )
+    para_map: Dict[str, Any] = {} if scale is None else {_SCALE_PARAM: scale}
+    return query_str, para_map
+
+
+@lru_cache(maxsize=128)
+def _degree_query_text(degree_params: str, scaled: bool) -> str:
+    return_items = f"n.id , {_DEGREE_REF}"
+    if scaled:
+        return_items = f"{return_items} * ${_SCALE_PARAM} AS {_DEGREE_REF}"
+
+    return _PLAN_CACHE_HINT + (
         QueryBuilder()
         .match()
         .node(ref_name=_NODE_REF)
         .call()
         .procedure(f"{_DEGREE_ALG}({degree_params})")
         .yield_((_DEGREE_REF, _DEGREE_REF))
-        .return_literal(f"n.id , {_DEGREE_REF}")
+        .return_literal(return_items)
         .query
-    ), {}
+    )
 
 
 def degree_centrality_mutation_query(parameters=None) -> Tuple[str, Dict[str, Any]]:
@@ -971,9 +1094,7 @@ def degree_centrality_mutation_query(parameters=None) -> Tuple[str, Dict[str, An
         >>> degree_centrality_query()
         (' CALL neptune.algo.degree.mutate({writeProperty:"degree"}) YIELD success AS success RETURN success', {})
     """
-    if parameters:
-        parameters_list_str = _to_parameter_list(parameters)
-        degree_params = f"{{{parameters_list_str}}}"
+    degree_params = _procedure_args(None, parameters)
     return (
         QueryBuilder()
         .call()
@@ -984,43 +1105,154 @@ def degree_centrality_mutation_query(parameters=None) -> Tuple[str, Dict[str, An
     ), {}
 
 
-def _append_node(
-    query_builder,
-    param_builder: ParameterMapBuilder,
-    node: Node,
-    ref_name: str = _NODE_REF,
-    incl_merge: bool = False,
-) -> QueryBuilder:
-    """
-    Helper method to append a node to a query builder.
-
-    :param query_builder: The QueryBuilder instance to modify
-    :param param_builder: The ParameterMapBuilder to use for masking properties
-    :param node: The node to append
-    :param ref_name: Reference name for the node (default: _NODE_REF)
-    :param incl_merge: If True, adds .merge() to the node creation (default: False)
-    :return: The modified QueryBuilder instance
-    """
-    # Mask node properties
-    updated_parameters = node.properties
-    updated_parameters["`~id`"] = str(node.id)
-
-    # Mask node properties
-    masked_properties = param_builder.read_map(updated_parameters)
-
-    # Add merge if requested
-    if incl_merge:
-        query_builder = query_builder.merge()
-
-    # Append the node to the query builder
-    query_builder = query_builder.node(
-        ref_name=ref_name,
-        labels=node.labels,
-        properties=masked_properties,
-        escape=False,
+def _with_id(node: Node) -> Dict[str, Any]:
+    """
+    Return the node's properties with its id added under the `~id` key. The node
+    itself is left untouched.
+
+    :param node: The node to read
+    :return: A new property map, including `~id`
+    """
+    return {**node.properties, _ID_PROPERTY: str(node.id)}
+
+
+def _render_assignments(masked: Dict[str, str], separator: str) -> str:
+    """
+    Render "key = $n" pairs as cymple's where_multiple/set do, for WHERE
+    (separator " AND ") and SET (separator ", ") clauses.
+    """
+    return separator.join(f"{key} = {value}" for key, value in masked.items())
+
+
+def _node_shape(labels, properties: Dict[str, Any]) -> Tuple[Any, Tuple[str, ...]]:
+    """
+    Hashable key for a node pattern: its labels and property keys, but not values.
+    """
+    return (labels if isinstance(labels, str) else tuple(labels)), tuple(properties)
+
+
+def _bind_values(*value_groups) -> Dict[str, Any]:
+    """
+    Number values in order as $0, $1, ..., matching the placeholders a template
+    was rendered with.
+    """
+    return {
+        str(index): value
+        for index, value in enumerate(chain.from_iterable(value_groups))
+    }
+
+
+def _render_shape(
+    ref_name: str, shape: Tuple[Any, Tuple[str, ...]], param_builder
+) -> str:
+    labels, keys = shape
+    return _render_node(ref_name, labels, param_builder.read_map(dict.fromkeys(keys)))
+
+
+# Bulk loads repeat the same labels and property keys with different values, so
+# the query text is rendered once per shape and only the values are re-bound
+@lru_cache(maxsize=1024)
+def _insert_node_template(shape: Tuple[Any, Tuple[str, ...]]) -> str:
+    return f" CREATE {_render_shape('', shape, ParameterMapBuilder())}"
+
+
+@lru_cache(maxsize=1024)
+def _delete_node_template(shape: Tuple[Any, Tuple[str, ...]]) -> str:
+    node_str = _render_shape(_NODE_REF, shape, ParameterMapBuilder())
+    return f" MATCH {node_str} DELETE {_NODE_REF}"
+
+
+@lru_cache(maxsize=1024)
+def _insert_edge_template(
+    src_shape: Tuple[Any, Tuple[str, ...]],
+    dest_shape: Tuple[Any, Tuple[str, ...]],
+    label: Optional[str],
+    edge_keys: Tuple[str, ...],
+    is_directed: bool,
+) -> str:
+    param_builder = ParameterMapBuilder()
+    src_str = _render_shape(_SRC_NODE_REF, src_shape, param_builder)
+    dest_str = _render_shape(_DEST_NODE_REF, dest_shape, param_builder)
+    relation_str = _render_relation(
+        _RELATION_REF,
+        label,
+        param_builder.read_map(dict.fromkeys(edge_keys)),
+        is_directed,
+    )
+    return "".join(
+        (
+            " MERGE ",
+            src_str,
+            " MERGE ",
+            dest_str,
+            f" MERGE ({_SRC_NODE_REF})",
+            relation_str,
+            f"({_DEST_NODE_REF})",
+        )
     )
 
-    return query_builder
+
+@lru_cache(maxsize=1024)
+def _delete_edge_template(
+    src_shape: Tuple[Any, Tuple[str, ...]],
+    dest_shape: Tuple[Any, Tuple[str, ...]],
+    label: Optional[str],
+    is_directed: bool,
+) -> str:
+    param_builder = ParameterMapBuilder()
+    src_str = _render_shape(_SRC_NODE_REF, src_shape, param_builder)
+    dest_str = _render_shape(_DEST_NODE_REF, dest_shape, param_builder)
+    relation_str = _render_relation(_RELATION_REF, label, {}, is_directed)
+    return f" MATCH {src_str}{relation_str}{dest_str} DELETE {_RELATION_REF}"
+
+
+def _render_labels(labels) -> str:
+    if not labels:
+        return ""
+    if isinstance(labels, str):
+        return f": {labels}"
+    return f': {": ".join(labels).strip()}'
+
+
+def _render_properties(masked_properties: Dict[str, str]) -> str:
+    if not masked_properties:
+        return ""
+    return f" {{{', '.join(f'{k} : {v}' for k, v in masked_properties.items())}}}"
+
+
+def _render_node(ref_name: str, labels, masked_properties: Dict[str, str]) -> str:
+    """
+    Render a node pattern in the same form cymple's ``node()`` produces, without
+    building a QueryBuilder chain.
+
+    :param ref_name: Reference name for the node, may be empty
+    :param labels: A label or list of labels, may be empty
+    :param masked_properties: Property map whose values are parameter placeholders
+    :return: The node pattern, e.g. "(a: Person {`~id` : $0})"
+    """
+    return (
+        f"({ref_name}{_render_labels(labels)}{_render_properties(masked_properties)})"
+    )
+
+
+def _render_relation(
+    ref_name: str,
+    label: Optional[str],
+    masked_properties: Dict[str, str],
+    is_directed: bool,
+) -> str:
+    """
+    Render a single-hop relationship pattern in the same form cymple produces.
+
+    :param ref_name: Reference name for the relationship
+    :param label: The relationship type, or None
+    :param masked_properties: Property map whose values are parameter placeholders
+    :param is_directed: Whether the relationship points from left to right
+    :return: The relationship pattern, e.g. "-[r: KNOWS]->"
+    """
+    relation_type = "" if label is None else f": {label}"
+    relation_str = f"[{ref_name}{relation_type}{_render_properties(masked_properties)}]"
+    return f"-{relation_str}->" if is_directed else f"-{relation_str}-"
 
 
 def _get_nodes_in_list(source_nodes: list[str]):
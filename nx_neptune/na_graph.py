@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License.
 import logging
 from asyncio import Task
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 import networkx
 from botocore.config import Config
@@ -31,12 +31,14 @@ from .clients import (
     NeptuneAnalyticsClient,
     Node,
     clear_query,
+    count_nodes,
     delete_edge,
     delete_node,
     insert_edge,
     insert_node,
     match_all_edges,
     match_all_nodes,
+    match_nodes_with_limit,
     update_edge,
     update_node,
 )
@@ -147,6 +149,9 @@ class NeptuneGraph:
     ):
         """
         Perform an update on node's properties.
+
+        Raises:
+            ValueError: If properties_set is empty.
         """
         query_str, para_map = update_node(
             match_labels, ref_name, [node.id], properties_set
@@ -163,6 +168,9 @@ class NeptuneGraph:
         """
         Perform an update on node's property for nodes with matching condition,
         which presented within the graph.
+
+        Raises:
+            ValueError: If nodes or properties_set is empty.
         """
         node_ids = [n.id for n in nodes]
         query_str, para_map = update_node(
@@ -264,18 +272,33 @@ class NeptuneGraph:
         query_str, para_map = delete_edge(edge)
         return self.na_client.execute_generic_query(query_str, para_map)
 
-    def get_all_nodes(self):
+    def get_all_nodes(self, limit: Optional[int] = None):
         """
         Helper method to return all nodes from the graph,
         in Python List object format.
 
+        Args:
+            limit: If provided, return at most this many nodes, with the LIMIT applied server-side.
+
         Returns:
             _type_: Nodes in JSON format.
         """
-        query_str = match_all_nodes()
+        query_str = (
+            match_all_nodes() if limit is None else match_nodes_with_limit(limit)
+        )
         all_nodes = self.na_client.execute_generic_query(query_str)
         return [node["n"] for node in all_nodes]
 
+    def count_nodes(self) -> int:
+        """
+        Helper method to count the nodes held in Neptune Analytics.
+
+        Returns:
+            int: Number of nodes in the remote graph.
+        """
+        result = self.na_client.execute_generic_query(count_nodes())
+        return result[0]["count"]
+
     def get_all_edges(self):
         """
         Helper method to return all edges from the graph,
@@ -299,6 +322,17 @@ class NeptuneGraph:
         """
         return self.na_client.execute_generic_query(query_string, parameter_map)
 
+    def execute_call_iter(
+        self, query_string: str, parameter_map: Optional[dict] = None
+    ) -> Iterator[Any]:
+        """
+        Helper method to call a Neptune Function and stream its result rows.
+
+        Returns:
+            Iterator: Result rows from the Boto client, parsed as they are read.
+        """
+        return self.na_client.execute_generic_query_iter(query_string, parameter_map)
+
 
 def get_config() -> NeptuneConfig:
     """
@@ -11,4 +11,18 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 # This file is intentionally left empty to mark the directory as a Python package
-from .decorators import configure_if_nx_active
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .decorators import configure_if_nx_active
+
+
+def __getattr__(name):
+    # Resolved lazily: decorators imports instance_management, which itself
+    # imports utils.task_future, so an eager import here forms a cycle when
+    # instance_management is the first module loaded.
+    if name == "configure_if_nx_active":
+        from . import decorators
+
+        return decorators.configure_if_nx_active
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -40,13 +40,14 @@ class TestDegreeCentrality:
     def mock_graph(self):
         """Create a mock NeptuneGraph for testing."""
         graph_nx = MagicMock(spec=NeptuneGraph)
-        # Mock the execute_call method to return a predefined result
+        # Mock the execute_call method to return a predefined result,
+        # with the degrees already normalised by Neptune
         graph_nx.execute_call.return_value = [
-            {"n.id": "A", "degree": 1},
-            {"n.id": "B", "degree": 2},
-            {"n.id": "C", "degree": 3},
-            {"n.id": "D", "degree": 2},
-            {"n.id": "E", "degree": 2},
+            {"n.id": "A", "degree": 0.5},
+            {"n.id": "B", "degree": 1.0},
+            {"n.id": "C", "degree": 1.5},
+            {"n.id": "D", "degree": 1.0},
+            {"n.id": "E", "degree": 1.0},
         ]
 
         graph = MagicMock(spec=Graph)
@@ -63,7 +64,7 @@ class TestDegreeCentrality:
 
             # Verify the correct query was built and executed
             parameters = {}
-            expected_query, param_values = degree_centrality_query(parameters)
+            expected_query, param_values = degree_centrality_query(parameters, 0.5)
 
             # No conversion should happen if method receiving networkX default.
             mock_graph.execute_call.assert_called_once_with(
@@ -82,7 +83,7 @@ class TestDegreeCentrality:
 
             # Verify the correct query was built and executed
             parameters = {PARAM_TRAVERSAL_DIRECTION: PARAM_TRAVERSAL_DIRECTION_INBOUND}
-            expected_query, param_values = degree_centrality_query(parameters)
+            expected_query, param_values = degree_centrality_query(parameters, 0.5)
 
             # No conversion should happen if method receiving networkX default.
             mock_graph.execute_call.assert_called_once_with(
@@ -101,7 +102,7 @@ class TestDegreeCentrality:
 
             # Verify the correct query was built and executed
             parameters = {PARAM_TRAVERSAL_DIRECTION: PARAM_TRAVERSAL_DIRECTION_OUTBOUND}
-            expected_query, param_values = degree_centrality_query(parameters)
+            expected_query, param_values = degree_centrality_query(parameters, 0.5)
 
             # No conversion should happen if method receiving networkX default.
             mock_graph.execute_call.assert_called_once_with(
@@ -112,6 +113,82 @@ class TestDegreeCentrality:
             # Verify the result contains the expected nodes with their degree values
             assert result == {"A": 0.5, "B": 1.0, "C": 1.5, "D": 1.0, "E": 1.0}
 
+    def test_in_degree_centrality_positional_options(self, mock_graph):
+        """Test that positional options still line up after the traversal direction is bound"""
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            in_degree_centrality(mock_graph, "test_vertex_label")
+
+            parameters = {
+                PARAM_TRAVERSAL_DIRECTION: PARAM_TRAVERSAL_DIRECTION_INBOUND,
+                PARAM_VERTEX_LABEL: "test_vertex_label",
+            }
+            expected_query, param_values = degree_centrality_query(parameters, 0.5)
+            mock_graph.execute_call.assert_called_once_with(
+                expected_query, param_values
+            )
+            assert in_degree_centrality.__name__ == "in_degree_centrality"
+
+    def test_degree_centrality_single_node(self, mock_graph):
+        """Test that a single-node graph is answered without calling Neptune"""
+        mock_graph.graph = Graph()
+        mock_graph.graph.add_node("A")
+
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            result = degree_centrality(mock_graph)
+
+            mock_graph.execute_call.assert_not_called()
+            assert result == {"A": 1.0}
+
+    def test_degree_centrality_empty_graph(self, mock_graph):
+        """Test that an empty graph is normalised by the node count held in Neptune"""
+        mock_graph.graph = Graph()
+        mock_graph.count_nodes.return_value = 5
+
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            degree_centrality(mock_graph)
+
+            mock_graph.count_nodes.assert_called_once_with()
+            expected_query, param_values = degree_centrality_query({}, 0.25)
+            mock_graph.execute_call.assert_called_once_with(
+                expected_query, param_values
+            )
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"skip_graph_reset": True, "import_s3_bucket": None},
+            {"skip_graph_reset": False, "import_s3_bucket": "bucket/path"},
+        ],
+    )
+    @patch("nx_neptune.algorithms.util.algorithm_utils.get_config")
+    def test_degree_centrality_remote_data(self, mock_get_config, config, mock_graph):
+        """Test that degrees are normalised by the Neptune node count when the local graph is partial"""
+        mock_get_config.return_value = MagicMock(**config)
+        mock_graph.count_nodes.return_value = 11
+
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            degree_centrality(mock_graph)
+
+            expected_query, param_values = degree_centrality_query({}, 0.1)
+            mock_graph.execute_call.assert_called_once_with(
+                expected_query, param_values
+            )
+
+    def test_degree_centrality_single_remote_node(self, mock_graph):
+        """Test that a lone node held in Neptune gets a centrality of 1, as in NX"""
+        mock_graph.graph = Graph()
+        mock_graph.count_nodes.return_value = 1
+        mock_graph.execute_call.return_value = [{"n.id": "A", "degree": 0}]
+
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            result = degree_centrality(mock_graph)
+
+            expected_query, param_values = degree_centrality_query({})
+            mock_graph.execute_call.assert_called_once_with(
+                expected_query, param_values
+            )
+            assert result == {"A": 1.0}
+
     def test_degree_centrality_extra_options(self, mock_graph):
         """Test Degree Centrality with Neptune Specific parameters"""
         # Set up the environment
@@ -130,7 +207,7 @@ class TestDegreeCentrality:
                 PARAM_CONCURRENCY: 0,
             }
 
-            expected_query, param_values = degree_centrality_query(parameters)
+            expected_query, param_values = degree_centrality_query(parameters, 0.5)
 
             # No conversion should happen if method receiving networkX default.
             mock_graph.execute_call.assert_called_once_with(
@@ -12,8 +12,10 @@
 # language governing permissions and limitations under the License.
 import os
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
+from networkx.classes import Graph
 
 from nx_neptune.clients import pagerank_query
 from nx_neptune.clients.neptune_constants import (
@@ -32,7 +34,7 @@ from nx_neptune.clients.neptune_constants import (
 )
 from nx_neptune.clients.opencypher_builder import pagerank_mutation_query
 from nx_neptune.na_graph import NeptuneGraph
-from nx_neptune.algorithms.link_analysis.pagerank import pagerank
+from nx_neptune.algorithms.link_analysis.pagerank import RankResult, pagerank
 
 
 class TestPageRank:
@@ -44,19 +46,12 @@ class TestPageRank:
         graph = MagicMock(spec=NeptuneGraph)
         # Mock the execute_call method to return a predefined result
         graph.execute_call.return_value = [
-            {
-                "n": {"~id": "1", "~labels": ["Person"], "~properties": {"name": "A"}},
-                "rank": 0.3,
-            },
-            {
-                "n": {"~id": "2", "~labels": ["Person"], "~properties": {"name": "B"}},
-                "rank": 0.2,
-            },
-            {
-                "n": {"~id": "3", "~labels": ["Person"], "~properties": {"name": "C"}},
-                "rank": 0.5,
-            },
+            {"nodeId": "1", "rank": 0.3},
+            {"nodeId": "2", "rank": 0.2},
+            {"nodeId": "3", "rank": 0.5},
         ]
+        graph.graph = MagicMock(spec=Graph)
+        graph.graph.number_of_nodes.return_value = 3
         return graph
 
     def test_pagerank_basic(self, mock_graph):
@@ -87,6 +82,77 @@ class TestPageRank:
             # Verify the result contains the expected nodes with their PageRank values
             assert result == {"1": 0.3, "2": 0.2, "3": 0.5}
 
+    def test_pagerank_defaults_reuse_prebuilt_query(self, mock_graph):
+        """Test that a call with only NX defaults does not rebuild the query."""
+        with (
+            patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}),
+            patch(
+                "nx_neptune.algorithms.link_analysis.pagerank.pagerank_query"
+            ) as mock_pagerank_query,
+        ):
+            pagerank(
+                mock_graph,
+                alpha=0.85,
+                personalization=None,
+                max_iter=100,
+                tol=1e-06,
+                nstart=None,
+            )
+
+            mock_pagerank_query.assert_not_called()
+            mock_graph.execute_call.assert_called_once_with(*pagerank_query())
+
+    def test_pagerank_defaults_use_fresh_parameter_map(self, mock_graph):
+        """Test that default-argument calls do not share one parameter map."""
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            for _ in range(2):
+                pagerank(mock_graph, 0.85, None, 100, 1e-06, None)
+
+            first, second = mock_graph.execute_call.call_args_list
+            assert first.args[1] == second.args[1] == {}
+            assert first.args[1] is not second.args[1]
+
+    def test_pagerank_return_numpy(self, mock_graph):
+        """Test that return_numpy gives a mapping backed by a float32 array."""
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            result = pagerank(
+                mock_graph,
+                alpha=0.85,
+                personalization=None,
+                max_iter=100,
+                tol=1e-06,
+                nstart=None,
+                return_numpy=True,
+            )
+
+            assert isinstance(result, RankResult)
+            assert result.ids == ["1", "2", "3"]
+            assert result.ranks.dtype == np.float32
+            np.testing.assert_allclose(result.ranks, [0.3, 0.2, 0.5], rtol=1e-6)
+            assert result["3"] == pytest.approx(0.5)
+            assert dict(result) == pytest.approx({"1": 0.3, "2": 0.2, "3": 0.5})
+            with pytest.raises(KeyError):
+                result["4"]
+
+    def test_pagerank_return_numpy_without_numpy(self, mock_graph):
+        """Test that return_numpy fails up front when numpy is not installed."""
+        with (
+            patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}),
+            patch("nx_neptune.algorithms.link_analysis.pagerank.np", None),
+        ):
+            with pytest.raises(ImportError, match="numpy"):
+                pagerank(
+                    mock_graph,
+                    alpha=0.85,
+                    personalization=None,
+                    max_iter=100,
+                    tol=1e-06,
+                    nstart=None,
+                    return_numpy=True,
+                )
+
+            mock_graph.execute_call.assert_not_called()
+
     def test_pagerank_with_alpha(self, mock_graph):
         """Test pagerank with custom alpha parameter (0.75)."""
         with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
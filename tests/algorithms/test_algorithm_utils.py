@@ -12,9 +12,15 @@
 # language governing permissions and limitations under the License.
 from unittest.mock import MagicMock, patch
 
+import networkx as nx
 import pytest
 
-from nx_neptune.algorithms.util.algorithm_utils import execute_mutation_query
+from nx_neptune.algorithms.util.algorithm_utils import (
+    execute_mutation_query,
+    graph_node_count,
+    process_unsupported_param,
+    single_node_result,
+)
 
 
 class TestAlgorithmUtils:
@@ -79,3 +85,76 @@ class TestAlgorithmUtils:
         )
 
         assert mock_logger.error.call_count == 0
+
+    @pytest.mark.parametrize(
+        "nodes, expected",
+        [
+            # Empty graphs run against the data already loaded in Neptune Analytics
+            ([], None),
+            (["A"], {"A": 1.0}),
+            (["A", "B"], None),
+        ],
+    )
+    @patch("nx_neptune.algorithms.util.algorithm_utils.get_config")
+    def test_single_node_result(self, mock_get_config, nodes, expected):
+        mock_get_config.return_value = MagicMock(
+            skip_graph_reset=False, import_s3_bucket=None
+        )
+        mock_neptune_graph = MagicMock()
+        mock_neptune_graph.graph = nx.Graph()
+        mock_neptune_graph.graph.add_nodes_from(nodes)
+
+        assert single_node_result(mock_neptune_graph, 1.0) == expected
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"skip_graph_reset": True, "import_s3_bucket": None},
+            {"skip_graph_reset": False, "import_s3_bucket": "bucket/path"},
+        ],
+    )
+    @patch("nx_neptune.algorithms.util.algorithm_utils.get_config")
+    def test_single_node_result_remote_data(self, mock_get_config, config):
+        mock_get_config.return_value = MagicMock(**config)
+        mock_neptune_graph = MagicMock()
+        mock_neptune_graph.graph = nx.Graph()
+        mock_neptune_graph.graph.add_node("A")
+
+        assert single_node_result(mock_neptune_graph, 1.0) is None
+
+    @pytest.mark.parametrize(
+        "nodes, config, expected",
+        [
+            (["A", "B"], {"skip_graph_reset": False, "import_s3_bucket": None}, 2),
+            # The local graph does not hold the data in Neptune, so it is counted there
+            ([], {"skip_graph_reset": False, "import_s3_bucket": None}, 7),
+            (["A", "B"], {"skip_graph_reset": True, "import_s3_bucket": None}, 7),
+            (["A", "B"], {"skip_graph_reset": False, "import_s3_bucket": "b/p"}, 7),
+        ],
+    )
+    @patch("nx_neptune.algorithms.util.algorithm_utils.get_config")
+    def test_graph_node_count(self, mock_get_config, nodes, config, expected):
+        mock_get_config.return_value = MagicMock(**config)
+        mock_neptune_graph = MagicMock()
+        mock_neptune_graph.graph = nx.Graph()
+        mock_neptune_graph.graph.add_nodes_from(nodes)
+        mock_neptune_graph.count_nodes.return_value = 7
+
+        assert graph_node_count(mock_neptune_graph) == expected
+
+    @patch("nx_neptune.algorithms.util.algorithm_utils.logger")
+    def test_process_unsupported_param_warns_for_set_values(self, mock_logger):
+        process_unsupported_param({"seed": None, "nstart": {}, "dangling": None})
+
+        mock_logger.warning.assert_called_once_with(
+            "'nstart' parameter is not supported in Neptune Analytics implementation. "
+            "This argument will be ignored and execution will proceed without it."
+        )
+
+    @patch("nx_neptune.algorithms.util.algorithm_utils.logger")
+    def test_process_unsupported_param_warnings_disabled(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = False
+
+        process_unsupported_param({"seed": 42})
+
+        mock_logger.warning.assert_not_called()
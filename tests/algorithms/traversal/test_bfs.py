@@ -48,20 +48,11 @@ class TestBfsEdges:
     def mock_graph(self):
         """Create a mock NeptuneGraph for testing."""
         graph = MagicMock(spec=NeptuneGraph)
-        # Mock the execute_call method to return a predefined result
-        graph.execute_call.return_value = [
-            {
-                "node": {"~id": "A", "~properties": {"name": "A-name"}},
-                "parent": {"~id": "A", "~properties": {"name": "A-name"}},
-            },
-            {
-                "node": {"~id": "B", "~properties": {"name": "B-name"}},
-                "parent": {"~id": "A", "~properties": {"name": "A-name"}},
-            },
-            {
-                "node": {"~id": "C", "~properties": {"name": "C-name"}},
-                "parent": {"~id": "A", "~properties": {"name": "A-name"}},
-            },
+        # Mock the execute_call_iter method to return the rows left after
+        # bfs_query filters out the source -> source row
+        graph.execute_call_iter.return_value = [
+            {"parentId": "A", "nodeId": "B"},
+            {"parentId": "A", "nodeId": "C"},
         ]
         graph.traversal_direction.return_value = "both"
         return graph
@@ -70,44 +61,11 @@ class TestBfsEdges:
     def mock_digraph(self):
         """Create a mock NeptuneGraph for testing."""
         graph = MagicMock(spec=NeptuneGraph)
-        # Mock the execute_call method to return a predefined result
-        graph.execute_call.return_value = [
-            {
-                "node": {
-                    "~id": "A",
-                    "~labels": ["Node"],
-                    "~properties": {"name": "A-name"},
-                },
-                "parent": {
-                    "~id": "A",
-                    "~labels": ["Node"],
-                    "~properties": {"name": "A-name"},
-                },
-            },
-            {
-                "node": {
-                    "~id": "B",
-                    "~labels": ["Node"],
-                    "~properties": {"name": "B-name"},
-                },
-                "parent": {
-                    "~id": "A",
-                    "~labels": ["Node"],
-                    "~properties": {"name": "A-name"},
-                },
-            },
-            {
-                "node": {
-                    "~id": "C",
-                    "~labels": ["Node"],
-                    "~properties": {"name": "C-name"},
-                },
-                "parent": {
-                    "~id": "A",
-                    "~labels": ["Node"],
-                    "~properties": {"name": "A-name"},
-                },
-            },
+        # Mock the execute_call_iter method to return the rows left after
+        # bfs_query filters out the source -> source row
+        graph.execute_call_iter.return_value = [
+            {"parentId": "A", "nodeId": "B"},
+            {"parentId": "A", "nodeId": "C"},
         ]
         # TODO fix
         graph.traversal_direction.return_value = '"both"'
@@ -155,7 +113,7 @@ class TestBfsEdges:
             )
 
             # Verify the function called execute_algo_bfs with correct parameters
-            mock_graph.execute_call.assert_called_once_with(
+            mock_graph.execute_call_iter.assert_called_once_with(
                 expected_query, param_values
             )
             assert "neptune.algo.bfs.parents" in expected_query
@@ -189,7 +147,7 @@ class TestBfsEdges:
                 f'{PARAM_TRAVERSAL_DIRECTION}:"{PARAM_TRAVERSAL_DIRECTION_INBOUND}"'
                 in expected_query
             )
-            mock_digraph.execute_call.assert_called_once_with(
+            mock_digraph.execute_call_iter.assert_called_once_with(
                 expected_query, param_values
             )
 
@@ -223,7 +181,7 @@ class TestBfsEdges:
                 in expected_query
             )
             assert f"{PARAM_MAX_DEPTH}:{depth_limit}" in expected_query
-            mock_digraph.execute_call.assert_called_once_with(
+            mock_digraph.execute_call_iter.assert_called_once_with(
                 expected_query, param_values
             )
 
@@ -252,16 +210,24 @@ class TestBfsEdges:
 
             # Verify the function called execute_algo_bfs with correct parameters
             assert "neptune.algo.bfs.parents" in expected_query
-            mock_graph.execute_call.assert_called_once_with(
+            mock_graph.execute_call_iter.assert_called_once_with(
                 expected_query, param_values
             )
 
             assert result == [["A", "B"], ["A", "C"]]
 
+    def test_bfs_edges_missing_column(self, mock_graph):
+        """Test bfs_edges reports a response row without the expected ids."""
+        with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
+            mock_graph.execute_call_iter.return_value = [{"parentId": "A"}]
+
+            with pytest.raises(ValueError, match="nodeId"):
+                list(bfs_edges(mock_graph, "A"))
+
     def test_bfs_edges_empty_result(self, mock_graph):
         """Test bfs_edges when no results are returned."""
         with patch.dict(os.environ, {"NX_ALGORITHM_TEST": "test_case"}):
-            mock_graph.execute_call.return_value = []
+            mock_graph.execute_call_iter.return_value = []
             source = "A"
 
             # Execute
@@ -324,8 +290,8 @@ class TestBfsEdges:
                 source_node, where_filters, parameters
             )
 
-            # Verify the function called execute_call with correct parameters
-            mock_graph.execute_call.assert_called_once_with(
+            # Verify the function called execute_call_iter with correct parameters
+            mock_graph.execute_call_iter.assert_called_once_with(
                 expected_query, param_values
             )
 
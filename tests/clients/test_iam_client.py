@@ -16,6 +16,7 @@ from nx_neptune.clients.iam_client import (
     IamClientWrapper,
     _get_s3_in_arn,
     _convert_sts_to_iam_arn,
+    _validate_arn,
     split_s3_arn_to_bucket_and_path,
 )
 
@@ -62,6 +63,17 @@ def test_validate_arns(arn):
         IamClientWrapper._validate_arns(arn)
 
 
+def test_validate_arns_caches_valid_arns():
+    role_arn = "arn:aws:iam::123456789012:role/test-role"
+    _validate_arn.cache_clear()
+
+    assert IamClientWrapper._validate_arns([role_arn, "arn:aws:s3:::test-bucket"])
+    assert IamClientWrapper._validate_arns(role_arn)
+
+    assert _validate_arn.cache_info().hits == 1
+    assert _validate_arn.cache_info().misses == 2
+
+
 @pytest.mark.parametrize(
     "arn, expected",
     [
@@ -190,6 +202,27 @@ class TestIamClientWrapper:
         result = iam_client.check_assume_role("neptune-graph.amazonaws.com")
         assert result is False
 
+    def test_check_assume_role_non_service_principal(self, mock_iam_client):
+        """Test check_assume_role skips statements whose principal is not a mapping."""
+        iam_client, mock_client = mock_iam_client
+
+        mock_client.get_role.return_value = {
+            "Role": {
+                "AssumeRolePolicyDocument": {
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Principal": "*",
+                            "Action": "sts:AssumeRole",
+                        }
+                    ]
+                }
+            }
+        }
+
+        result = iam_client.check_assume_role("neptune-graph")
+        assert result is False
+
     def test_has_create_na_permissions_success(self, mock_iam_client):
         """Test has_create_na_permissions with valid permissions."""
         iam_client, mock_client = mock_iam_client
@@ -420,6 +453,77 @@ class TestIamClientWrapper:
             with pytest.raises(ValueError, match="does not have versioning enabled"):
                 iam_client.has_export_to_s3_permissions("arn:aws:s3:::test-bucket")
 
+    @pytest.mark.parametrize("kms_key_decision", ["allowed", "implicitDeny"])
+    def test_has_export_to_s3_permissions_with_kms_key(
+        self, mock_iam_client, kms_key_decision
+    ):
+        """Test that S3 and KMS permissions are checked in a single simulation."""
+        from unittest.mock import patch
+
+        iam_client, mock_client = mock_iam_client
+        bucket_arn = "arn:aws:s3:::test-bucket"
+        key_arn = "arn:aws:kms:us-east-1:123456789012:key/test-key"
+
+        mock_client.get_role.return_value = {
+            "Role": {
+                "AssumeRolePolicyDocument": {
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Principal": {"Service": "neptune-graph.amazonaws.com"},
+                            "Action": "sts:AssumeRole",
+                        }
+                    ]
+                }
+            }
+        }
+
+        def evaluation_result(action, allowed_resource, decision="allowed"):
+            # Each action is simulated against both resources, but is only granted on one
+            return {
+                "EvalActionName": action,
+                "EvalDecision": "implicitDeny",
+                "ResourceSpecificResults": [
+                    {
+                        "EvalResourceName": resource,
+                        "EvalResourceDecision": (
+                            decision if resource == allowed_resource else "implicitDeny"
+                        ),
+                    }
+                    for resource in (bucket_arn, key_arn)
+                ],
+            }
+
+        mock_client.simulate_principal_policy.return_value = {
+            "EvaluationResults": [
+                evaluation_result(action, bucket_arn)
+                for action in ("s3:PutObject", "s3:DeleteObject", "s3:ListBucket")
+            ]
+            + [
+                evaluation_result(action, key_arn, kms_key_decision)
+                for action in ("kms:Decrypt", "kms:GenerateDataKey", "kms:DescribeKey")
+            ]
+        }
+
+        with patch.object(iam_client, "check_s3_versioning_enabled"):
+            if kms_key_decision == "allowed":
+                iam_client.has_export_to_s3_permissions("s3://test-bucket", key_arn)
+            else:
+                with pytest.raises(ValueError, match="kms:Decrypt"):
+                    iam_client.has_export_to_s3_permissions("s3://test-bucket", key_arn)
+
+        mock_client.simulate_principal_policy.assert_called_once()
+        call_kwargs = mock_client.simulate_principal_policy.call_args[1]
+        assert call_kwargs["ResourceArns"] == [bucket_arn, key_arn]
+        assert call_kwargs["ActionNames"] == [
+            "s3:PutObject",
+            "s3:DeleteObject",
+            "s3:ListBucket",
+            "kms:Decrypt",
+            "kms:GenerateDataKey",
+            "kms:DescribeKey",
+        ]
+
     def test_check_s3_versioning_enabled_with_mock_client(self, mock_iam_client):
         """Test check_s3_versioning_enabled with injected mock S3 client."""
         from unittest.mock import MagicMock
@@ -12,9 +12,11 @@
 # language governing permissions and limitations under the License.
 import pytest
 import json
+import math
 from io import BytesIO
 from unittest.mock import MagicMock, patch
 
+from nx_neptune.clients import na_client as na_client_module
 from nx_neptune.clients.na_client import NeptuneAnalyticsClient
 
 
@@ -200,6 +202,52 @@ class TestNeptuneAnalyticsClient:
         call_kwargs = mock_na_client.client.execute_query.call_args[1]
         assert "queryTimeoutMilliseconds" not in call_kwargs
 
+    @pytest.mark.parametrize("orjson_installed", [True, False])
+    def test_execute_generic_query_non_standard_json(
+        self, mock_na_client, orjson_installed
+    ):
+        """Test that payloads with NaN or 64-bit overflowing integers are still decoded."""
+        mock_response = {
+            "payload": BytesIO(
+                b'{"results": [{"score": NaN, "id": 18446744073709551616}]}'
+            )
+        }
+        mock_na_client.client.execute_query.return_value = mock_response
+
+        with patch.object(
+            na_client_module,
+            "orjson",
+            na_client_module.orjson if orjson_installed else None,
+        ):
+            result = mock_na_client.execute_generic_query("MATCH (n) RETURN n")
+
+        assert math.isnan(result[0]["score"])
+        assert result[0]["id"] == 2**64
+
+    @pytest.mark.parametrize("ijson_installed", [True, False])
+    def test_execute_generic_query_iter(self, mock_na_client, ijson_installed):
+        """Test that execute_generic_query_iter yields the result rows lazily."""
+        payload = BytesIO(b'{"results": [{"id": "A", "score": 0.5}, {"id": "B"}]}')
+        mock_na_client.client.execute_query.return_value = {"payload": payload}
+
+        with patch.object(
+            na_client_module,
+            "ijson",
+            na_client_module.ijson if ijson_installed else None,
+        ):
+            rows = mock_na_client.execute_generic_query_iter(
+                "MATCH (n) RETURN n", {"limit": 2}
+            )
+            # Nothing is sent until the first row is requested
+            mock_na_client.client.execute_query.assert_not_called()
+            result = list(rows)
+
+        assert result == [{"id": "A", "score": 0.5}, {"id": "B"}]
+        call_kwargs = mock_na_client.client.execute_query.call_args[1]
+        assert call_kwargs["queryString"] == "MATCH (n) RETURN n"
+        assert call_kwargs["parameters"] == {"limit": 2}
+        assert payload.closed
+
     @patch("nx_neptune.clients.client_factory.boto3")
     def test_init_with_timeout_sets_read_timeout(self, mock_boto3):
         """Test that timeout_seconds sets read_timeout on the boto3 Config."""
@@ -218,6 +266,14 @@ class TestNeptuneAnalyticsClient:
         config = mock_boto3.client.call_args[1]["config"]
         assert config.read_timeout == 60
 
+    @patch("nx_neptune.clients.client_factory.boto3")
+    def test_init_enables_tcp_keepalive(self, mock_boto3):
+        """Test that the Neptune Analytics client keeps its connections alive."""
+        NeptuneAnalyticsClient(graph_id="g-123", timeout_seconds=30)
+
+        config = mock_boto3.client.call_args[1]["config"]
+        assert config.tcp_keepalive is True
+
     @patch("nx_neptune.clients.client_factory.boto3")
     def test_init_with_client_ignores_timeout_seconds(self, mock_boto3):
         """Test that providing a client uses it directly; timeout_seconds does not create a new client."""
@@ -227,3 +283,15 @@ class TestNeptuneAnalyticsClient:
         )
         assert na.client == mock_client
         mock_boto3.client.assert_not_called()
+
+    @patch("nx_neptune.clients.client_factory.boto3")
+    def test_init_reuses_client_for_same_timeout(self, mock_boto3):
+        """Test that repeated construction with one configuration builds one boto3 client."""
+        first = NeptuneAnalyticsClient(graph_id="g-123", timeout_seconds=120)
+        second = NeptuneAnalyticsClient(graph_id="g-456", timeout_seconds=120)
+
+        mock_boto3.client.assert_called_once()
+        assert first.client is second.client
+        config = mock_boto3.client.call_args[1]["config"]
+        assert config.max_pool_connections == 32
+        assert config.retries == {"mode": "standard", "max_attempts": 5}
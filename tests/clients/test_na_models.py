@@ -81,6 +81,17 @@ class TestNode:
         assert node.labels == ["Person", "Employee"]
         assert node.properties == {"name": "Alice", "age": 30}
 
+    def test_from_neptune_response_interns_labels(self):
+        """Test that labels decoded from separate rows share one string object."""
+        first = Node.from_neptune_response(
+            {"~id": "1", "~labels": ["".join(["Per", "son"])]}
+        )
+        second = Node.from_neptune_response(
+            {"~id": "2", "~labels": ["".join(["Pers", "on"])]}
+        )
+
+        assert first.labels[0] is second.labels[0]
+
     def test_eq(self):
         """Test the equality operator."""
         node1 = Node(id="123", labels=["Person"], properties={"name": "Alice"})
@@ -96,12 +107,28 @@ class TestNode:
         # Comparison with non-Node object
         assert node1 != "not a node"
 
+    def test_hash(self):
+        """Test that nodes equal by id hash alike and de-duplicate in a set."""
+        node1 = Node(id="123", labels=["Person"], properties={"name": "Alice"})
+        node2 = Node(id="123", labels=["Employee"], properties={"name": "Bob"})
+        node3 = Node(id="456", labels=["Person"], properties={"name": "Alice"})
+
+        assert hash(node1) == hash(node2)
+        assert {node1, node2, node3} == {node1, node3}
+
     def test_repr(self):
         """Test the string representation."""
         node = Node(id="A", labels=["Person"], properties={"name": "Alice"})
         expected = "Node(id=A, labels=['Person'], properties={'name': 'Alice'})"
         assert repr(node) == expected
 
+    def test_slots(self):
+        """Test that nodes only hold their declared attributes."""
+        node = Node(id="A")
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.name = "Alice"
+
 
 class TestEdge:
     def test_edge_init(self):
@@ -313,3 +340,10 @@ class TestEdge:
             f"node_dest={dest_node}, is_directed=True)"
         )
         assert repr(edge) == expected
+
+    def test_slots(self):
+        """Test that edges only hold their declared attributes."""
+        edge = Edge(node_src=Node("Alice"), node_dest=Node("Bob"))
+        assert not hasattr(edge, "__dict__")
+        with pytest.raises(AttributeError):
+            edge.weight = 1.0
@@ -13,6 +13,8 @@
 import unittest
 from nx_neptune.clients.opencypher_builder import (
     match_all_nodes,
+    match_nodes_with_limit,
+    count_nodes,
     match_all_edges,
     clear_query,
     bfs_query,
@@ -44,6 +46,27 @@ class TestOpencypherBuilder(unittest.TestCase):
         expected_query = " MATCH (n) RETURN n"
         self.assertEqual(query, expected_query)
 
+    def test_count_nodes(self):
+        """
+        Test the count_nodes function to ensure it generates the correct OpenCypher query.
+        """
+        self.assertEqual(count_nodes(), " MATCH (n) RETURN count(n) AS count")
+
+    def test_match_nodes_with_limit(self):
+        """
+        Test the match_nodes_with_limit function.
+        """
+        self.assertEqual(match_nodes_with_limit(10), " MATCH (n) RETURN n LIMIT 10")
+
+    def test_match_nodes_with_limit_invalid_input(self):
+        """
+        Test that match_nodes_with_limit rejects invalid limits.
+        """
+        with self.assertRaises(ValueError):
+            match_nodes_with_limit(-1)
+        with self.assertRaises(ValueError):
+            match_nodes_with_limit("10")
+
     def test_match_all_edges(self):
         """
         Test the match_all_edges function to ensure it generates the correct OpenCypher query.
@@ -67,6 +90,27 @@ class TestOpencypherBuilder(unittest.TestCase):
         expected_query = " MATCH (n) DETACH DELETE n"
         self.assertEqual(query, expected_query)
 
+    def test_constant_queries_are_built_once(self):
+        """
+        Test that the input-free queries return the same prebuilt string on every call.
+        """
+        self.assertIs(match_all_nodes(), match_all_nodes())
+        self.assertIs(match_all_edges(), match_all_edges())
+        self.assertIs(clear_query(), clear_query())
+
+    def test_procedure_args(self):
+        """
+        Test the CALL argument list with and without a source and options.
+        """
+        from nx_neptune.clients.opencypher_builder import _procedure_args
+
+        self.assertEqual(_procedure_args("n", None), "n")
+        self.assertEqual(_procedure_args("n", {"maxDepth": 3}), "n, {maxDepth:3}")
+        self.assertEqual(
+            _procedure_args(None, {"writeProperty": "rank"}), '{writeProperty:"rank"}'
+        )
+        self.assertEqual(_procedure_args(None, {}), "")
+
     def test_bfs_query(self):
         """
         Test the bfs_query function to ensure it generates the correct OpenCypher query
@@ -81,10 +125,28 @@ class TestOpencypherBuilder(unittest.TestCase):
         # Check that the query is exactly as expected
         self.assertEqual(
             query[0],
-            ' MATCH (n) WHERE id(n) = $0 CALL neptune.algo.bfs.parents(n, {maxDepth:1, traversalDirection:"inbound"}) YIELD parent AS parent, node AS node RETURN parent, node',
+            'USING QUERY:PLANCACHE "enabled" MATCH (n) WHERE id(n) = $0 CALL neptune.algo.bfs.parents(n, {maxDepth:1, traversalDirection:"inbound"}) YIELD parent AS parent, node AS node WHERE id(node) <> id(parent) RETURN id(parent) AS parentId, id(node) AS nodeId',
         )
         self.assertEqual(query[1], {"0": "Alice"})
 
+    def test_algorithm_query_text_is_reused(self):
+        """
+        Test that repeated pagerank/degree calls with the same options reuse one
+        query string while still returning their own parameter maps.
+        """
+        from nx_neptune.clients.opencypher_builder import degree_centrality_query
+
+        first_query, first_params = pagerank_query({"dampingFactor": 0.9})
+        second_query, second_params = pagerank_query({"dampingFactor": 0.9})
+        self.assertIs(first_query, second_query)
+        self.assertIsNot(first_params, second_params)
+
+        self.assertIs(
+            degree_centrality_query(scale=0.5)[0],
+            degree_centrality_query(scale=0.25)[0],
+        )
+        self.assertEqual(degree_centrality_query(scale=0.25)[1], {"scale": 0.25})
+
     def test_pagerank_query_default(self):
         """Test the pagerank_query function with default parameters."""
         # Test case 1: Default parameters (no parameters provided)
@@ -92,7 +154,7 @@ class TestOpencypherBuilder(unittest.TestCase):
         print(query_str)
         self.assertEqual(
             query_str,
-            " MATCH (n) CALL neptune.algo.pageRank(n) YIELD rank AS rank RETURN n, rank",
+            'USING QUERY:PLANCACHE "enabled" MATCH (n) CALL neptune.algo.pageRank(n) YIELD rank AS rank RETURN id(n) AS nodeId, rank AS rank',
         )
         self.assertEqual(params, {})
 
@@ -103,22 +165,22 @@ class TestOpencypherBuilder(unittest.TestCase):
             (
                 "With dampingFactor parameter",
                 {"dampingFactor": 0.5},
-                " MATCH (n) CALL neptune.algo.pageRank(n, {dampingFactor:0.5}) YIELD rank AS rank RETURN n, rank",
+                'USING QUERY:PLANCACHE "enabled" MATCH (n) CALL neptune.algo.pageRank(n, {dampingFactor:0.5}) YIELD rank AS rank RETURN id(n) AS nodeId, rank AS rank',
             ),
             (
                 "With numOfIterations parameter",
                 {"numOfIterations": 20},
-                " MATCH (n) CALL neptune.algo.pageRank(n, {numOfIterations:20}) YIELD rank AS rank RETURN n, rank",
+                'USING QUERY:PLANCACHE "enabled" MATCH (n) CALL neptune.algo.pageRank(n, {numOfIterations:20}) YIELD rank AS rank RETURN id(n) AS nodeId, rank AS rank',
             ),
             (
                 "With numOfIterations parameter",
                 {"tolerance": 0.1},
-                " MATCH (n) CALL neptune.algo.pageRank(n, {tolerance:0.1}) YIELD rank AS rank RETURN n, rank",
+                'USING QUERY:PLANCACHE "enabled" MATCH (n) CALL neptune.algo.pageRank(n, {tolerance:0.1}) YIELD rank AS rank RETURN id(n) AS nodeId, rank AS rank',
             ),
             (
                 "With numOfIterations parameter",
                 {"edgeWeightProperty": "test_field", "edgeWeightType": "double"},
-                ' MATCH (n) CALL neptune.algo.pageRank(n, {edgeWeightProperty:"test_field", edgeWeightType:"double"}) YIELD rank AS rank RETURN n, rank',
+                'USING QUERY:PLANCACHE "enabled" MATCH (n) CALL neptune.algo.pageRank(n, {edgeWeightProperty:"test_field", edgeWeightType:"double"}) YIELD rank AS rank RETURN id(n) AS nodeId, rank AS rank',
             ),
         ]
 
@@ -127,6 +189,47 @@ class TestOpencypherBuilder(unittest.TestCase):
                 query_str, params = pagerank_query(parameters)
                 self.assertEqual(query_str, expected_query)
 
+    def test_insert_node_does_not_mutate_node(self):
+        """
+        Test that building queries leaves the node's own properties unchanged.
+        """
+        node = Node(id="123", labels=["Person"], properties={"name": "Alice"})
+
+        insert_node(node)
+        delete_node(node)
+
+        self.assertEqual(node.properties, {"name": "Alice"})
+
+    def test_insert_edge_reuses_template_for_same_shape(self):
+        """
+        Test that edges sharing labels and property keys reuse one query string
+        while binding their own values.
+        """
+        first_query, first_params = insert_edge(
+            Edge(
+                label="KNOWS",
+                properties={"since": 2020},
+                node_src=Node(id="1", labels=["Person"], properties={"name": "A"}),
+                node_dest=Node(id="2", labels=["Person"]),
+            )
+        )
+        second_query, second_params = insert_edge(
+            Edge(
+                label="KNOWS",
+                properties={"since": 1999},
+                node_src=Node(id="3", labels=["Person"], properties={"name": "C"}),
+                node_dest=Node(id="4", labels=["Person"]),
+            )
+        )
+
+        self.assertIs(first_query, second_query)
+        self.assertEqual(
+            first_query,
+            " MERGE (a: Person {name : $0, `~id` : $1}) MERGE (b: Person {`~id` : $2})"
+            " MERGE (a)-[r: KNOWS {since : $3}]->(b)",
+        )
+        self.assertEqual(second_params, {"0": "C", "1": "3", "2": "4", "3": 1999})
+
     def test_insert_edge_parameterized(self):
         """
         Parameterized test for inserting edges with various configurations using Edge with embedded nodes.
@@ -673,6 +776,16 @@ class TestOpencypherBuilder(unittest.TestCase):
                 self.assertEqual(query_result[0], expected_query)
                 self.assertEqual(query_result[1], expected_params)
 
+    def test_update_node_empty_input(self):
+        """
+        Test that update_node rejects empty node ids or properties instead of
+        building a query with an empty WHERE or SET clause.
+        """
+        with self.assertRaises(ValueError):
+            update_node("Person", "a", [], {"a.age": "25"})
+        with self.assertRaises(ValueError):
+            update_node("Person", "a", ["Alice"], {})
+
     def test_delete_node_parameterized(self):
         """
         Parameterized test for deleting nodes with various configurations.
@@ -786,6 +899,18 @@ class TestOpencypherBuilder(unittest.TestCase):
                 " MATCH (a: Person {`~id` : $0})-[r: FRIEND_WITH]->(b: Person {`~id` : $1}) DELETE r",
                 {"0": "123", "1": "456"},
             ),
+            (
+                "Undirected edge",
+                Edge(
+                    label="FRIEND_WITH",
+                    properties={},
+                    node_src=Node(id="123", labels=["Person"]),
+                    node_dest=Node(id="456", labels=["Person"]),
+                    is_directed=False,
+                ),
+                " MATCH (a: Person {`~id` : $0})-[r: FRIEND_WITH]-(b: Person {`~id` : $1}) DELETE r",
+                {"0": "123", "1": "456"},
+            ),
             (
                 "Edge between different node types",
                 Edge(
@@ -894,6 +1019,19 @@ class TestOpencypherBuilderAdditional(unittest.TestCase):
         self.assertEqual(len(params), 1)
         self.assertIn("nodes", params[0])
 
+    def test_insert_nodes_reuses_batch_query(self):
+        """Test that batches with the same labels reuse one query string."""
+        from nx_neptune.clients.opencypher_builder import insert_nodes
+
+        first, _ = insert_nodes([Node(id="1", labels=["Person", "Employee"])])
+        second, _ = insert_nodes([Node(id="2", labels=["Person", "Employee"])])
+
+        self.assertIs(first[0], second[0])
+        self.assertEqual(
+            first[0],
+            "UNWIND $nodes as node CREATE (n:Person:Employee {`~id`: node.id}) SET n += node",
+        )
+
     def test_insert_edges(self):
         """Test insert_edges batch operation."""
         from nx_neptune.clients.opencypher_builder import insert_edges
@@ -1022,10 +1160,22 @@ class TestOpencypherBuilderAdditional(unittest.TestCase):
         from nx_neptune.clients.opencypher_builder import degree_centrality_query
 
         query, params = degree_centrality_query()
+        self.assertTrue(query.startswith('USING QUERY:PLANCACHE "enabled" MATCH'))
         self.assertIn("degree", query)
         self.assertIn("YIELD", query)
         self.assertEqual(params, {})
 
+    def test_degree_centrality_query_with_scale(self):
+        """Test that degree_centrality_query normalises the degree with a parameter."""
+        from nx_neptune.clients.opencypher_builder import degree_centrality_query
+
+        query, params = degree_centrality_query(None, 0.25)
+        self.assertTrue(query.endswith("RETURN n.id , degree * $scale AS degree"))
+        self.assertEqual(params, {"scale": 0.25})
+
+        # The scale is not inlined, so the query text does not depend on it
+        self.assertEqual(query, degree_centrality_query(None, 0.5)[0])
+
     def test_degree_centrality_mutation_query(self):
         """Test degree_centrality_mutation_query."""
         from nx_neptune.clients.opencypher_builder import (
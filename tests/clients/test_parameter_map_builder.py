@@ -79,3 +79,20 @@ class TestParameterMapBuilder:
 
         # Check counter was incremented correctly
         assert builder._counter == 3
+
+    def test_read_list_after_read_map(self):
+        """Test that list and map reads share one placeholder sequence."""
+        builder = ParameterMapBuilder()
+
+        assert builder.read_map({"name": "John", "age": 30}) == {
+            "name": "$0",
+            "age": "$1",
+        }
+        assert builder.read_list(["a", "b", "c"]) == ["$2", "$3", "$4"]
+        assert builder.get_param_values() == {
+            "0": "John",
+            "1": 30,
+            "2": "a",
+            "3": "b",
+            "4": "c",
+        }
@@ -32,5 +32,7 @@ def reset_client_factory():
     from nx_neptune.clients.client_factory import ClientFactory
 
     ClientFactory._default = None
+    ClientFactory._configured.clear()
     yield
     ClientFactory._default = None
+    ClientFactory._configured.clear()
@@ -10,6 +10,9 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import subprocess
+import sys
+
 import pytest
 from nx_neptune import NeptuneGraph
 from importlib.metadata import entry_points, EntryPoint
@@ -19,6 +22,32 @@ def test_base():
     assert NeptuneGraph.NAME == "nx_neptune"
 
 
+def test_lazy_exports():
+    import nx_neptune
+
+    for name in nx_neptune.__all__:
+        assert hasattr(nx_neptune, name)
+        assert name in dir(nx_neptune)
+
+    with pytest.raises(AttributeError):
+        nx_neptune.not_an_export
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "nx_neptune.instance_management",
+        "nx_neptune.session_manager",
+        "nx_neptune.utils.decorators",
+        "nx_neptune.algorithms",
+        "nx_neptune.interface",
+    ],
+)
+def test_submodule_imports_first(module):
+    # Exports are resolved lazily, so each submodule must import cleanly on its own
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+
+
 def test_backends_ep():
     assert entry_points(group="networkx.backends")["neptune"] == EntryPoint(
         name="neptune",
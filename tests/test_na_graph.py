@@ -28,6 +28,8 @@ from nx_neptune.clients import (
     Edge,
     clear_query,
     match_all_nodes,
+    match_nodes_with_limit,
+    count_nodes,
     match_all_edges,
     update_node,
     delete_node,
@@ -146,6 +148,15 @@ class TestNeptuneGraph:
         )
         assert result == {"client": "response"}
 
+    def test_update_nodes_empty(self, neptune_graph, mock_client):
+        """Test update_nodes raises on empty input without querying Neptune"""
+        with pytest.raises(ValueError):
+            neptune_graph.update_nodes("Person", "n", [], {"n.age": 30})
+        with pytest.raises(ValueError):
+            neptune_graph.update_nodes("Person", "n", [Node(id="John")], {})
+
+        mock_client.execute_generic_query.assert_not_called()
+
     def test_delete_nodes(self, neptune_graph, mock_client):
         """Test delete_nodes method"""
         node = Node(id=123, properties={"name": "TestNode", "prop": "value"})
@@ -249,6 +260,25 @@ class TestNeptuneGraph:
         mock_client.execute_generic_query.assert_called_once_with(expected_query)
         assert result == ["node1", "node2"]
 
+    def test_get_all_nodes_with_limit(self, neptune_graph, mock_client):
+        mock_client.execute_generic_query.return_value = [{"n": "node1"}]
+
+        """Test get_all_nodes method with a server-side limit"""
+        result = neptune_graph.get_all_nodes(limit=1)
+
+        expected_query = match_nodes_with_limit(1)
+        mock_client.execute_generic_query.assert_called_once_with(expected_query)
+        assert result == ["node1"]
+
+    def test_count_nodes(self, neptune_graph, mock_client):
+        mock_client.execute_generic_query.return_value = [{"count": 3}]
+
+        """Test count_nodes method"""
+        result = neptune_graph.count_nodes()
+
+        mock_client.execute_generic_query.assert_called_once_with(count_nodes())
+        assert result == 3
+
     def test_get_all_edges(self, neptune_graph, mock_client):
         mock_client.execute_generic_query.return_value = [
             {"r": "relationship1"},